@@ -7,7 +7,6 @@ simple text-based commands: soothe, struggle, relax, and call (if HT radio avail
 
 from __future__ import annotations
 
-import json
 import random
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
@@ -18,6 +17,7 @@ from .encounter_outcomes import (
     UI,
     resolve_encounter_outcome,
 )
+from .json_data import read_json_cached
 from .vore import is_vore_enabled
 from .rapport import change_rapport, get_rapport
 
@@ -40,9 +40,8 @@ def _load_races_if_needed() -> Optional[dict[str, dict[str, object]]]:
         data_dir, _ = main.resolve_paths()
         races_path = data_dir / "races.json"
         if races_path.exists():
-            with races_path.open("r", encoding="utf-8") as handle:
-                _races_cache = json.load(handle)
-                return _races_cache
+            _races_cache = read_json_cached(races_path)
+            return _races_cache
     except Exception:
         pass
     return None
@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-import json
 from collections import Counter
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from .json_data import read_json
 from .state import GameState
 
 
@@ -104,8 +104,7 @@ class CookingCatalog:
 def load_cooking_catalog(data_dir: Path) -> CookingCatalog:
     """Load cooking recipes from JSON file."""
     path = data_dir / "cooking_recipes.json"
-    with path.open("r", encoding="utf-8") as handle:
-        raw = json.load(handle)
+    raw = read_json(path)
     
     recipes: Dict[str, CookingRecipe] = {}
     for recipe_id, data in raw.items():
@@ -125,6 +124,5 @@ def load_cooking_catalog(data_dir: Path) -> CookingCatalog:
 def load_food_items(data_dir: Path) -> Dict[str, Dict[str, str]]:
     """Load food item definitions from JSON file."""
     path = data_dir / "items_food.json"
-    with path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+    return read_json(path)
 
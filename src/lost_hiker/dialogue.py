@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-import json
 import random
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any
 
+from .json_data import read_json
 from .state import GameState
 from .rapport import get_rapport, get_rapport_tier, change_rapport
 from .runestones import get_runestone_state
@@ -84,14 +85,12 @@ class DialogueCatalog:
 
     def __init__(self, nodes: List[DialogueNode]):
         self.nodes = nodes
-        self._by_id: Dict[str, DialogueNode] = {
-            node.node_id: node for node in nodes
-        }
+        # Index by id and by NPC in a single pass over the merged node list
+        self._by_id: Dict[str, DialogueNode] = {}
         self._by_npc: Dict[str, List[DialogueNode]] = {}
         for node in nodes:
-            if node.npc_id not in self._by_npc:
-                self._by_npc[node.npc_id] = []
-            self._by_npc[node.npc_id].append(node)
+            self._by_id[node.node_id] = node
+            self._by_npc.setdefault(node.npc_id, []).append(node)
 
     def get_node(self, node_id: str, state: Optional[GameState] = None) -> Optional[DialogueNode]:
         """
@@ -636,8 +635,7 @@ def load_dialogue_catalog(data_dir: Path, filename: str = "dialogue_forest.json"
     if not path.exists():
         return DialogueCatalog([])
     
-    with path.open("r", encoding="utf-8") as handle:
-        raw = json.load(handle)
+    raw = read_json(path)
     
     nodes = [
         DialogueNode.from_dict(entry)
@@ -646,3 +644,38 @@ def load_dialogue_catalog(data_dir: Path, filename: str = "dialogue_forest.json"
     
     return DialogueCatalog(nodes)
 
+
+class LazyDialogueCatalog(DialogueCatalog):
+    """
+    Dialogue catalog that reads its files on first use.
+
+    Quitting or opening Settings from the main menu never talks to an NPC,
+    so the dialogue files are only read and merged when a conversation
+    first looks up a node.
+    """
+
+    def __init__(self, data_dir: Path, filenames: Iterable[str]):
+        # The node index is built by _loaded, not DialogueCatalog.__init__
+        self._data_dir = data_dir
+        self._filenames = tuple(filenames)
+
+    @cached_property
+    def _loaded(self) -> DialogueCatalog:
+        """Load every file in order and merge the nodes into one catalog."""
+        nodes: List[DialogueNode] = []
+        for filename in self._filenames:
+            nodes.extend(load_dialogue_catalog(self._data_dir, filename).nodes)
+        return DialogueCatalog(nodes)
+
+    @property
+    def nodes(self) -> List[DialogueNode]:
+        return self._loaded.nodes
+
+    @property
+    def _by_id(self) -> Dict[str, DialogueNode]:
+        return self._loaded._by_id
+
+    @property
+    def _by_npc(self) -> Dict[str, List[DialogueNode]]:
+        return self._loaded._by_npc
+
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import json
 import random
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from .json_data import read_json
 from .state import GameState
 from .rapport import get_rapport, change_rapport, get_rapport_tier
 
@@ -332,8 +332,7 @@ def load_encounter_definitions(data_dir: Path, filename: str) -> List[EncounterD
     if not path.exists():
         return []
     
-    with path.open("r", encoding="utf-8") as handle:
-        data = json.load(handle)
+    data = read_json(path)
     
     encounters = []
     for entry in data.get("encounters", []):
@@ -6,7 +6,7 @@ import math
 import random
 from collections import Counter
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterable, Optional, Protocol
+from typing import Any, Dict, Iterable, Optional, Protocol, Sequence
 
 from .character import TimedModifier
 from .events import Event, EventPool
@@ -29,6 +29,7 @@ from .runestones import (
     mark_runestone_discovered,
     update_quest_state_after_repair,
     get_runestone_at_landmark,
+    get_runestone_state,
 )
 from .forest_effects import (
     get_stamina_cost_modifier,
@@ -66,9 +67,9 @@ from .wayfinding import (
     get_valid_wayfinding_destinations,
     execute_wayfinding_teleport,
 )
-from .encounters import EncounterEngine, load_encounter_definitions
-from .rapport import get_rapport_tier
-from .npcs import NPCCatalog, load_npc_catalog
+from .encounters import EncounterEngine, load_encounter_definitions, EncounterDefinition
+from .rapport import get_rapport_tier, change_rapport
+from .npcs import NPCCatalog, load_npc_catalog, NPC
 from .rare_lore_events import RareLoreEventSystem
 from .dialogue import (
     DialogueCatalog,
@@ -84,6 +85,8 @@ from .echo import (
     pet_echo,
     hug_echo,
     boop_echo,
+    change_echo_rapport,
+    get_echo_rapport,
 )
 from .rapport import get_rapport
 from .tea_flavor import enhance_tea_description
@@ -92,6 +95,55 @@ from .encounter_outcomes import (
     OutcomeContext,
     resolve_encounter_outcome,
 )
+from .forest_act1 import (
+    init_forest_act1_state,
+    should_show_completion_narrative,
+    get_threat_encounter_modifier,
+    get_forest_act1_progress_summary,
+    mark_completion_acknowledged,
+    should_show_first_runestone_tip,
+    is_forest_act1_complete,
+)
+from .belly_interaction import (
+    resolve_belly_on_load,
+    is_belly_active,
+    handle_belly_action,
+    exit_belly_state,
+    enter_belly_state,
+)
+from .time_of_day import get_time_of_day, advance_time_of_day
+from .combat import (
+    recover_condition_at_camp,
+    calculate_flee_success,
+    calculate_calm_success,
+    calculate_stand_ground_success,
+    change_condition,
+    get_condition_label,
+    should_force_retreat,
+    get_condition_effects,
+)
+from .npc_appearance import get_present_npcs, get_npc_presence_description
+from .echo_vore import (
+    trigger_echo_belly_shelter,
+    update_echo_vore_tension,
+    release_player_from_echo_belly,
+)
+from .sky import get_sky_description
+from .vore import is_vore_enabled
+from .flavor_profiles import (
+    get_resting_flavor,
+    get_forest_magic_size_flavor,
+    get_foraging_flavor,
+    get_exploration_flavor,
+)
+from .micro_quests import (
+    check_blue_fireflies_event,
+    trigger_blue_fireflies_event,
+    check_echo_checkin,
+    trigger_echo_checkin,
+    check_echo_favor,
+    trigger_echo_favor,
+)
 
 
 class UI(Protocol):
@@ -101,6 +153,11 @@ class UI(Protocol):
 
     def echo(self, text: str) -> None: ...
 
+    def echo_lines(self, lines: Sequence[str]) -> None:
+        """Echo each entry in turn; UIs may override to write them at once."""
+        for line in lines:
+            self.echo(line)
+
     def menu(self, prompt: str, options: list[str]) -> str: ...
 
     def prompt(self, prompt: str) -> str: ...
@@ -136,6 +193,7 @@ class Engine:
     encounter_engine: EncounterEngine | None = None
     npc_catalog: NPCCatalog = field(default_factory=lambda: NPCCatalog([]))
     dialogue_catalog: DialogueCatalog = field(default_factory=lambda: DialogueCatalog([]))
+    rng: random.Random = field(default_factory=random.Random)
     rare_lore_events: Optional[RareLoreEventSystem] = field(default=None, init=False)
     _ate_proper_meal_yesterday: bool = field(default=False, init=False)
     _day_start_inventory: list[str] = field(default_factory=list, init=False)
@@ -167,11 +225,9 @@ class Engine:
     def run(self) -> None:
         """Run until the player chooses to exit."""
         # Initialize forest_act1 state on game start
-        from .forest_act1 import init_forest_act1_state
         init_forest_act1_state(self.state)
         
         # Resolve belly state on load (Phase 1: safe resolution)
-        from .belly_interaction import resolve_belly_on_load
         resolve_belly_on_load(self.state, ui=self.ui)
         
         while self.state.stage == "intro":
@@ -193,7 +249,6 @@ class Engine:
             if choice == "yes":
                 self.state.new_day(self.season_config)
                 # Apply Echo vore tension decay on new day
-                from .echo_vore import update_echo_vore_tension
                 update_echo_vore_tension(self.state, increase=False)
             else:
                 keep_playing = False
@@ -210,7 +265,6 @@ class Engine:
         self._wake_phase()
         
         # Check for belly state first (suspends normal exploration)
-        from .belly_interaction import is_belly_active
         if is_belly_active(self.state):
             self._belly_phase()
             return
@@ -317,10 +371,9 @@ class Engine:
                 should_release = True
             elif entry_method == "boop" and self.state.time_of_day == "Dawn":
                 # Boop entries: 80% chance to be released at dawn
-                should_release = random.random() < 0.8
+                should_release = self.rng.random() < 0.8
             
             if should_release:
-                from .echo_vore import release_player_from_echo_belly
                 self.ui.echo(
                     "As dawn breaks, Echo's warmth shifts around you. "
                     "Slowly, carefully, she releases you back into the Glade.\n"
@@ -347,18 +400,15 @@ class Engine:
         self._describe_zone("glade", depth=0)
         
         # Check for Act I completion narrative when entering Glade
-        from .forest_act1 import should_show_completion_narrative
         if should_show_completion_narrative(self.state):
             self.ui.echo(
                 "\nAs you return to the Glade, you feel a shift in the air—a sense of calm, of stability. "
                 "The forest's pulse feels steadier, the ley-lines humming with restored rhythm. "
                 "You've done something important. The way forward feels clearer now.\n"
             )
-            from .forest_act1 import mark_completion_acknowledged
             mark_completion_acknowledged(self.state)
         
         # Check for rare lore events when entering Glade (especially at night)
-        from .time_of_day import get_time_of_day
         time_of_day = get_time_of_day(self.state)
         if time_of_day.value in ("Night", "Dusk"):
             rare_events = self._get_rare_lore_events()
@@ -409,7 +459,6 @@ class Engine:
 
     def _belly_phase(self) -> None:
         """Handle belly interaction loop (Phase 1: Non-lethal Shelter/Struggle Loop)."""
-        from .belly_interaction import is_belly_active, handle_belly_action, exit_belly_state
         
         if not is_belly_active(self.state):
             # Belly state was cleared, exit
@@ -549,7 +598,6 @@ class Engine:
                     ),
                 )
             elif verb == "check sky":
-                from .sky import get_sky_description
                 description = get_sky_description(self.state)
                 self.ui.echo(f"{description}\n")
             else:
@@ -649,7 +697,6 @@ class Engine:
             self._show_field_bag()
             return "stay"
         if verb == "check sky":
-            from .sky import get_sky_description
             description = get_sky_description(self.state)
             self.ui.echo(f"{description}\n")
             return "stay"
@@ -776,7 +823,6 @@ class Engine:
 
     def _handle_rub_echo_belly(self) -> None:
         """Handle rubbing Echo's belly walls."""
-        from .rapport import get_rapport, change_rapport
         rapport = get_rapport(self.state, "echo")
         
         # Rubbing can increase rapport slightly (once per belly visit)
@@ -805,8 +851,6 @@ class Engine:
 
     def _handle_rest_in_echo_belly(self, stamina_max: float) -> None:
         """Handle resting in Echo's belly - fully restores stamina and treats as safe camp."""
-        from .time_of_day import advance_time_of_day
-        from .combat import recover_condition_at_camp
         
         # Fully restore stamina
         self.state.stamina = stamina_max
@@ -918,7 +962,6 @@ class Engine:
                 self._show_field_bag()
                 return "stay"
             if verb == "check sky":
-                from .sky import get_sky_description
                 description = get_sky_description(self.state)
                 self.ui.echo(f"{description}\n")
                 return "stay"
@@ -951,7 +994,6 @@ class Engine:
                 return "stay"
             if verb in {"talk", "speak", "chat"}:
                 # Check if there's an NPC at this landmark using appearance logic
-                from .npc_appearance import get_present_npcs
                 present_npcs = get_present_npcs(self.npc_catalog, self.state, current_landmark.landmark_id)
                 if present_npcs:
                     # If there's exactly one NPC, talk to them
@@ -1016,7 +1058,6 @@ class Engine:
             self._show_field_bag()
             return "stay"
         if verb == "check sky":
-            from .sky import get_sky_description
             description = get_sky_description(self.state)
             self.ui.echo(f"{description}\n")
             return "stay"
@@ -1201,7 +1242,6 @@ class Engine:
                 description_parts.append("It's territorial and will charge if threatened.")
         
         # Add rapport information if available
-        from .rapport import get_rapport, get_rapport_tier
         rapport = get_rapport(self.state, creature_id)
         rapport_tier = get_rapport_tier(rapport)
         if rapport != 0:
@@ -1306,16 +1346,14 @@ class Engine:
         final_chance = base_chance * depth_multiplier * season_multiplier * stamina_multiplier
         final_chance = min(0.25, final_chance)  # Cap at 25%
         
-        if random.random() > final_chance:
+        if self.rng.random() > final_chance:
             return False
         
         # Get time of day
-        from .time_of_day import get_time_of_day
         time_of_day_enum = get_time_of_day(self.state)
         time_of_day_str = time_of_day_enum.value
         
         # Get forest stability modifier
-        from .forest_act1 import get_threat_encounter_modifier
         stability_modifier = get_threat_encounter_modifier(self.state)
         
         # Determine depth band for creature preferences
@@ -1423,7 +1461,6 @@ class Engine:
                 if "mystical" in tags or "leyline-tuned" in tags:
                     # Special handling for Kirin: rare early Act I, more reliable post-stabilization
                     if creature_id == "kirin":
-                        from .forest_act1 import get_forest_act1_progress_summary
                         summary = get_forest_act1_progress_summary(self.state)
                         # Kirin is very rare before Act I completion
                         if not self.state.act1_forest_stabilized or self.state.act1_repaired_runestones < 3:
@@ -1440,7 +1477,6 @@ class Engine:
                             weight *= 1.5  # More likely at landmarks
                     else:
                         # Other mystical creatures
-                        from .forest_act1 import get_forest_act1_progress_summary
                         summary = get_forest_act1_progress_summary(self.state)
                         if "Stabilized" in summary["status"] or "Complete" in summary["status"]:
                             weight *= 1.7  # Increased from 1.5 to 1.7
@@ -1484,7 +1520,7 @@ class Engine:
         if not available_creatures:
             return False
         
-        selected_creature = random.choices(
+        selected_creature = self.rng.choices(
             available_creatures, weights=creature_weights, k=1
         )[0]
         
@@ -1506,10 +1542,10 @@ class Engine:
                     )
                 ]
                 if valid_threat:
-                    encounter = random.choice(valid_threat)
+                    encounter = self.rng.choice(valid_threat)
                 else:
                     # Fall back to any threat encounter if none match conditions
-                    encounter = random.choice(all_threat_encounters)
+                    encounter = self.rng.choice(all_threat_encounters)
         
         # Fall back to normal encounter selection (includes both normal and threat encounters)
         if not encounter:
@@ -1529,15 +1565,6 @@ class Engine:
     
     def _run_encounter(self, encounter, *, depth: int = 0) -> None:
         """Run a creature encounter with player choices."""
-        from .encounters import EncounterDefinition
-        from .combat import (
-            calculate_flee_success,
-            calculate_calm_success,
-            calculate_stand_ground_success,
-            change_condition,
-            get_condition_label,
-            should_force_retreat,
-        )
         
         # Display intro text
         self.ui.echo(f"\n{encounter.intro_text}\n")
@@ -1614,8 +1641,6 @@ class Engine:
         # Check for vore outcomes
         if outcome.text == "VORE_SWALLOWED":
             # Handle predator vore outcome (non-lethal shelter)
-            from .vore import is_vore_enabled
-            from .belly_interaction import enter_belly_state
             
             # Only enter belly state if vore is enabled
             if is_vore_enabled(self.state):
@@ -1634,7 +1659,6 @@ class Engine:
                 
                 # Add Forest magic flavor if player is larger than predator
                 try:
-                    from .flavor_profiles import get_forest_magic_size_flavor
                     magic_flavor = get_forest_magic_size_flavor(player_size, predator_size)
                     if magic_flavor:
                         self.ui.echo(f"{magic_flavor}\n")
@@ -1677,14 +1701,6 @@ class Engine:
         self, encounter, outcome, selected_choice, *, depth: int
     ) -> None:
         """Resolve a threat encounter using combat mechanics."""
-        from .combat import (
-            calculate_flee_success,
-            calculate_calm_success,
-            calculate_stand_ground_success,
-            change_condition,
-            get_condition_label,
-            should_force_retreat,
-        )
         
         resolution_type = outcome.threat_resolution
         creature_id = encounter.creature_id
@@ -1788,7 +1804,6 @@ class Engine:
             change_condition(self.state, condition_increase)
         
         if rapport_change != 0:
-            from .rapport import change_rapport
             change_rapport(self.state, creature_id, rapport_change)
         
         # Display result
@@ -1971,7 +1986,6 @@ class Engine:
         self.state.pending_radio_upgrade = False
         self.state.pending_radio_return_day = None
         self.state.radio_version = 2
-        from .echo import change_echo_rapport
         change_echo_rapport(self.state, 1)
 
     def _apply_pending_brews(self) -> None:
@@ -1989,8 +2003,7 @@ class Engine:
                 "A pulse of blue static thrums like a heartbeat, Echo's emotions washing over you without words.",
                 "The radio crackles with sun-hot warmth and the distant echo of hissing laughter.",
             ]
-            self.ui.echo(random.choice(impressions) + "\n")
-            from .echo import get_echo_rapport
+            self.ui.echo(self.rng.choice(impressions) + "\n")
             rapport = get_echo_rapport(self.state)
             if not self.state.pending_radio_upgrade and rapport > 5:
                 if self.state.vore_enabled:
@@ -2000,7 +2013,6 @@ class Engine:
                 self.ui.echo(upgrade + "\n")
                 self.state.pending_radio_upgrade = True
                 self.state.pending_radio_return_day = self.state.day + 1
-                from .echo import change_echo_rapport
                 change_echo_rapport(self.state, 1)
             elif rapport <= 5:
                 self.ui.echo(
@@ -2012,8 +2024,7 @@ class Engine:
             '"You breathing alright? Take water before you range," Echo crackles, concern threading the words.',
             '"Trail spirits are calm. Call if shadows crowd you," Echo\'s voice hums, almost musical.',
         ]
-        self.ui.echo(random.choice(clear_messages) + "\n")
-        from .echo import change_echo_rapport
+        self.ui.echo(self.rng.choice(clear_messages) + "\n")
         change_echo_rapport(self.state, 1)
 
     def _available_teas(self) -> dict[str, dict[str, object]]:
@@ -2189,7 +2200,6 @@ class Engine:
             
             # Show first runestone tip if this is the first discovery
             if was_first:
-                from .forest_act1 import should_show_first_runestone_tip
                 if should_show_first_runestone_tip(self.state):
                     self.ui.echo(
                         "\nYou sense this stone is part of a damaged pattern; Echo or the hermit might know more.\n"
@@ -2206,7 +2216,6 @@ class Engine:
                 self.ui.echo(f"\n{text}\n")
         
         # Check for NPCs at this landmark using appearance logic
-        from .npc_appearance import get_present_npcs, get_npc_presence_description
         present_npcs = get_present_npcs(self.npc_catalog, self.state, landmark.landmark_id)
         if present_npcs or landmark.features.get("has_npc"):
             # Add NPC description
@@ -2271,7 +2280,6 @@ class Engine:
         
         # Check for runestone
         if landmark.features.get("has_runestone") and target_lower in {"runestone", "stone", "rune", "plinth"}:
-            from .runestones import get_runestone_state
             runestone_state = get_runestone_state(self.state, landmark.landmark_id)
             
             if runestone_state.get("is_fully_repaired", False):
@@ -2510,14 +2518,14 @@ class Engine:
                         # Creek landmarks can yield watercress, tubers, or aquatic creatures
                         if landmark.features.get("has_creek", False):
                             choices = ["watercress", "creek_tuber", "creek_darter", "silt_crab"]
-                            food_item = random.choice(choices)
+                            food_item = self.rng.choice(choices)
                         else:
-                            food_item = random.choice(["watercress", "creek_tuber"])
+                            food_item = self.rng.choice(["watercress", "creek_tuber"])
                     elif food_type == "creek_aquatic":
                         # Specifically aquatic creatures at creek/river landmarks
                         choices = ["creek_darter", "stoneback_trout", "silt_crab"]
                         weights = [0.5, 0.2, 0.3]  # Darter more common, trout rarer
-                        food_item = random.choices(choices, weights=weights, k=1)[0]
+                        food_item = self.rng.choices(choices, weights=weights, k=1)[0]
                     elif food_type == "edible_fungus":
                         food_item = "edible_fungus"
                     elif food_type == "night_mushrooms":
@@ -2525,7 +2533,7 @@ class Engine:
                     elif food_type == "cave_forage":
                         # Cave-mouth landmarks yield spores, grubs, and fungi
                         choices = ["burrow_puff_spores", "barkgrub", "glow_tail_larva"]
-                        food_item = random.choice(choices)
+                        food_item = self.rng.choice(choices)
                     elif food_type == "mystical_herbs":
                         # Mystical landmarks yield magical plants and fungi
                         # Only if runestones repaired
@@ -2534,7 +2542,7 @@ class Engine:
                                 "wisp_petal_blossom", "dreammilk_moss", "veilgrass_tuft",
                                 "glow_sap_resin_nodule", "starlace_fungus"
                             ]
-                            food_item = random.choice(choices)
+                            food_item = self.rng.choice(choices)
                         else:
                             # Fallback to common items if no runestones repaired yet
                             food_item = "edible_mushroom"
@@ -2562,7 +2570,6 @@ class Engine:
                     
                     # Add optional tag-based foraging flavor
                     try:
-                        from .flavor_profiles import get_foraging_flavor
                         flavor_text = get_foraging_flavor(self.state.character)
                         if flavor_text:
                             self.ui.echo(f"{base_message} {flavor_text}\n")
@@ -2653,7 +2660,6 @@ class Engine:
                 )
             elif repaired_count >= 3:
                 # Check if this is the moment of completion
-                from .forest_act1 import is_forest_act1_complete, should_show_completion_narrative
                 was_complete = is_forest_act1_complete(self.state)
                 self.ui.echo(
                     "\nThe forest's pulse stabilizes completely. The magical grid hums with restored power, "
@@ -2664,7 +2670,6 @@ class Engine:
                     self.ui.echo(
                         "\nThe Forest steadies around you. The worst distortions have faded.\n"
                     )
-                    from .forest_act1 import mark_completion_acknowledged
                     mark_completion_acknowledged(self.state)
 
     def _print_landmark_help(self, landmark: Landmark) -> None:
@@ -2683,7 +2688,6 @@ class Engine:
             "help — show this help",
         ]
         # Check if there's an NPC at this landmark
-        from .npc_appearance import get_present_npcs
         present_npcs = get_present_npcs(self.npc_catalog, self.state, landmark.landmark_id)
         if present_npcs or landmark.features.get("has_npc"):
             lines.insert(-1, "talk — speak with someone here")
@@ -2695,8 +2699,6 @@ class Engine:
         if hasattr(self.ui, 'clear_content'):
             self.ui.clear_content()
         
-        from .npcs import NPC
-        from .forest_act1 import should_show_completion_narrative
         
         # Determine starting node based on whether intro is done
         npc_flags = self.state.npc_flags.get(npc.npc_id, {})
@@ -2753,7 +2755,6 @@ class Engine:
         
         # Mark completion narrative as acknowledged if we just saw it
         if starting_node_id in ("echo_act1_complete", "forest_hermit_act1_complete"):
-            from .forest_act1 import mark_completion_acknowledged
             mark_completion_acknowledged(self.state)
         
         self.ui.echo(f"\nYou finish your conversation with {npc.name}.\n")
@@ -2802,7 +2803,6 @@ class Engine:
             self.ui.clear_content()
         
         # Check if Act I is complete and show completion dialogue if not yet acknowledged
-        from .forest_act1 import should_show_completion_narrative
         starting_node_id = None
         if should_show_completion_narrative(self.state):
             starting_node_id = "echo_act1_complete"
@@ -2832,7 +2832,6 @@ class Engine:
                 # If it has multiple sentences or is very long, it's probably a full sentence
                 if sentence_endings > 1 or (len(text_body) > 100 and sentence_endings > 0):
                     # Show fallback impressionistic message instead
-                    import random
                     impressions = [
                         "[RADIO] Warm static. Curious pulse.",
                         "[RADIO] A rush of forest scents through the static.",
@@ -2840,7 +2839,7 @@ class Engine:
                         "[RADIO] Blue pulse thrums. Emotions without words.",
                         "[RADIO] Static crackles. Sun-hot warmth. Distant hissing.",
                     ]
-                    npc_text = random.choice(impressions)
+                    npc_text = self.rng.choice(impressions)
             
             self.ui.echo(f"\n{npc_text}\n")
             
@@ -2861,7 +2860,6 @@ class Engine:
         
         # Mark completion narrative as acknowledged if we just saw it
         if starting_node_id == "echo_act1_complete":
-            from .forest_act1 import mark_completion_acknowledged
             mark_completion_acknowledged(self.state)
         
         self.ui.echo("\nYou finish your conversation with Echo.\n")
@@ -2880,7 +2878,6 @@ class Engine:
 
     def _handle_hug_echo(self) -> None:
         """Handle hugging Echo interaction - a warm, heartfelt action."""
-        from .echo_vore import trigger_echo_belly_shelter
         
         description, gained_rapport, vore_triggered, entry_method = hug_echo(self.state)
         
@@ -2896,7 +2893,6 @@ class Engine:
 
     def _handle_boop_echo(self) -> None:
         """Handle booping Echo interaction - a playful action."""
-        from .echo_vore import trigger_echo_belly_shelter
         
         description, gained_rapport, vore_triggered, entry_method = boop_echo(self.state)
         
@@ -2971,13 +2967,12 @@ class Engine:
             
             # Check for collapse - condition increases risk
             if self.state.stamina <= 0:
-                from .combat import get_condition_effects, should_force_retreat
                 condition_effects = get_condition_effects(self.state)
                 # Base collapse chance when stamina hits 0, modified by condition
                 base_collapse_chance = 0.7  # 70% base chance
                 collapse_risk = min(1.0, base_collapse_chance * condition_effects["collapse_risk_multiplier"])
                 # If condition is high and stamina is 0, always collapse
-                if should_force_retreat(self.state) or random.random() < collapse_risk:
+                if should_force_retreat(self.state) or self.rng.random() < collapse_risk:
                     self._collapse_from_exhaustion(zone_id=zone_id, stamina_max=stamina_max)
                     return
                 # Otherwise, just set stamina to 0 and continue (very low stamina)
@@ -3003,7 +2998,6 @@ class Engine:
                 return "quit"
 
     def _camp_phase(self, *, zone_id: str, stamina_max: float) -> None:
-        from .time_of_day import advance_time_of_day
         self.state.stage = "camp"
         self.state.active_zone = zone_id
         # Track that player rested at camp (best rest)
@@ -3018,7 +3012,6 @@ class Engine:
         
         # Add optional tag-based resting flavor
         try:
-            from .flavor_profiles import get_resting_flavor
             flavor_text = get_resting_flavor(self.state.character, context="camp")
             if flavor_text:
                 self.ui.echo(f"{flavor_text}\n")
@@ -3027,13 +3020,11 @@ class Engine:
         
         # Check for Blue Fireflies event (Spring night at Glade)
         if zone_id == "glade":
-            from .micro_quests import check_blue_fireflies_event, trigger_blue_fireflies_event
             if check_blue_fireflies_event(self.state):
                 trigger_blue_fireflies_event(self.state, self.ui)
         
         # Check for Echo check-in or favor events at Glade
         if zone_id == "glade":
-            from .micro_quests import check_echo_checkin, trigger_echo_checkin, check_echo_favor, trigger_echo_favor
             if check_echo_checkin(self.state):
                 trigger_echo_checkin(self.state, self.ui)
             elif check_echo_favor(self.state):
@@ -3143,7 +3134,6 @@ class Engine:
                 self._show_notebook(zone_id=zone_id, stamina_max=stamina_max)
                 continue
             if verb == "check sky":
-                from .sky import get_sky_description
                 description = get_sky_description(self.state)
                 self.ui.echo(f"{description}\n")
                 continue
@@ -3174,7 +3164,6 @@ class Engine:
                     continue
             if verb in {"sleep", "rest"}:
                 # Check for Act I completion narrative before sleeping
-                from .forest_act1 import should_show_completion_narrative
                 if should_show_completion_narrative(self.state):
                     self.ui.echo(
                         "\nAs you settle in for the night, a dream comes to you—vivid and clear. "
@@ -3183,11 +3172,9 @@ class Engine:
                         "anchoring the magical grid. You wake with a sense of accomplishment, knowing the forest "
                         "has stabilized. The way forward feels clearer now.\n"
                     )
-                    from .forest_act1 import mark_completion_acknowledged
                     mark_completion_acknowledged(self.state)
                 
                 # Advance time significantly when sleeping (sleep advances to next day)
-                from .time_of_day import advance_time_of_day
                 # Advance to Night, then the new_day() call will reset to Dawn
                 advance_time_of_day(self.state, steps=2)
                 break
@@ -3199,14 +3186,12 @@ class Engine:
         self._summarize_day("Camp Summary", stamina_max, zone_id=zone_id)
 
     def _perform_explore_action(self, *, zone_id: str) -> None:
-        from .time_of_day import advance_time_of_day
         depth = self.state.zone_depths.get(zone_id, 0) + 1
         
         # Apply depth gating based on runestone repairs
         if zone_id == "forest" and not should_allow_deep_depth_roll(self.state, depth):
             # Soft gate: reduce depth increment chance
-            import random
-            if random.random() > 0.3:  # 70% chance to stay at current depth
+            if self.rng.random() > 0.3:  # 70% chance to stay at current depth
                 depth = self.state.zone_depths.get(zone_id, 0)
         
         self.state.zone_depths[zone_id] = depth
@@ -3283,7 +3268,6 @@ class Engine:
                     # Add optional tag-based exploration flavor (for non-encounter events)
                     if event.event_type != "encounter":
                         try:
-                            from .flavor_profiles import get_exploration_flavor
                             flavor_text = get_exploration_flavor(self.state.character)
                             if flavor_text:
                                 summary = summary.rstrip("\n") + f"\n{flavor_text}"
@@ -3309,7 +3293,6 @@ class Engine:
             self._maybe_trigger_kirin_foreshadowing()
 
     def _return_to_glade(self, *, zone_id: str, stamina_max: float) -> None:
-        from .time_of_day import advance_time_of_day
         self.state.stage = "return"
         self.state.active_zone = "glade"
         self.state.zone_steps.pop(zone_id, None)
@@ -3329,7 +3312,6 @@ class Engine:
 
     def _collapse_from_exhaustion(self, *, zone_id: str, stamina_max: float) -> None:
         """Handle collapse from exhaustion using the unified outcome system."""
-        from .time_of_day import advance_time_of_day
         self.state.stage = "collapse"
         
         # Use COLLAPSE outcome
@@ -3351,7 +3333,6 @@ class Engine:
         # Advance day (collapse represents significant time passing)
         self.state.new_day(self.season_config)
         # Apply Echo vore tension decay on new day
-        from .echo_vore import update_echo_vore_tension
         update_echo_vore_tension(self.state, increase=False)
         
         # Summarize the day after collapse
@@ -3383,7 +3364,6 @@ class Engine:
     ) -> None:
         # Recover condition at camp (Glade rest)
         if self.state.rest_type == "camp" and self.state.condition > 0:
-            from .combat import recover_condition_at_camp, get_condition_label
             old_condition = self.state.condition
             recover_condition_at_camp(self.state)
             if self.state.condition < old_condition:
@@ -3458,7 +3438,6 @@ class Engine:
         depth = depths_source.get(active_zone, 0)
         persistent_steps = steps_source.get(active_zone, 0)
         hunger_status = f"{self.state.days_without_meal} day{'s' if self.state.days_without_meal != 1 else ''} without a proper meal"
-        from .combat import get_condition_label
         condition_label = get_condition_label(self.state.condition)
         snapshot = [
             f"Hunger: {hunger_status}",
@@ -3472,7 +3451,6 @@ class Engine:
         )
 
     def _show_notebook(self, *, zone_id: str, stamina_max: float) -> None:
-        from .time_of_day import get_time_of_day
         zone_label = zone_id.replace("_", " ").title()
         depth = self.state.zone_depths.get(zone_id, 0)
         persistent_steps = self.state.zone_steps.get(zone_id, 0)
@@ -3480,7 +3458,6 @@ class Engine:
         character = self.state.character
         name = character.name or "Wanderer"
         race = character.race_id.replace("_", " ").title()
-        from .combat import get_condition_label
         condition_label = get_condition_label(self.state.condition)
         time_of_day = get_time_of_day(self.state)
         season_name = self.state.get_season_name().title()
@@ -3521,7 +3498,6 @@ class Engine:
             lines.append(f"Trail markers: {persistent_steps}")
         
         # Act I quest progress
-        from .forest_act1 import get_forest_act1_progress_summary, init_forest_act1_state
         init_forest_act1_state(self.state)
         summary = get_forest_act1_progress_summary(self.state)
         lines.append(f"\nForest Ley-Lines: {summary['status']}")
@@ -3792,7 +3768,6 @@ class Engine:
         Trigger Kirin foreshadowing events based on interest level.
         These are flavor-only hints, not full encounters.
         """
-        import random
         
         # Base chance increases with interest level
         # Tuned: Kirin should be rare early, more common as Act I progresses
@@ -3805,7 +3780,7 @@ class Engine:
         if base_chance == 0.0:
             return
         
-        if random.random() > base_chance:
+        if self.rng.random() > base_chance:
             return
         
         # Select a foreshadowing hint based on interest level
@@ -3830,7 +3805,7 @@ class Engine:
             ])
         
         if hints:
-            self.ui.echo(f"\n{random.choice(hints)}\n")
+            self.ui.echo(f"\n{self.rng.choice(hints)}\n")
     
     def _handle_kirin_travel(self, *, zone_id: str) -> None:
         """
@@ -3910,7 +3885,6 @@ class Engine:
             self.state, selected_destination, selected_display_name, self.ui, travel_mode=travel_mode
         )
         # Advance time (long-distance travel takes time)
-        from .time_of_day import advance_time_of_day
         advance_time_of_day(self.state, steps=1)
     
     def _handle_wayfind(self, *, zone_id: str) -> None:
@@ -3971,7 +3945,6 @@ class Engine:
             self.state, self.landmarks, selected_destination, selected_display_name, self.ui
         )
         # Advance time (wayfinding takes time)
-        from .time_of_day import advance_time_of_day
         advance_time_of_day(self.state, steps=1)
     
     def _handle_cook(self, at_camp: bool = False) -> None:
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import json
 import random
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from .json_data import read_json_cached
 from .state import GameState
 from .character import TimedModifier
 from .seasons import get_seasonal_weight
@@ -26,9 +26,8 @@ def _load_races_if_needed() -> Optional[Dict[str, Dict[str, object]]]:
         data_dir, _ = main.resolve_paths()
         races_path = data_dir / "races.json"
         if races_path.exists():
-            with races_path.open("r", encoding="utf-8") as handle:
-                _races_cache = json.load(handle)
-                return _races_cache
+            _races_cache = read_json_cached(races_path)
+            return _races_cache
     except Exception:
         pass
     return None
@@ -355,7 +354,6 @@ class EventPool:
 def load_event_pool(data_dir: Path, filename: str) -> EventPool:
     """Load an event pool from disk."""
     path = data_dir / filename
-    with path.open("r", encoding="utf-8") as handle:
-        raw = json.load(handle)
+    raw = read_json_cached(path)
     events = [Event.from_dict(entry) for entry in raw.get("events", [])]
     return EventPool(events)
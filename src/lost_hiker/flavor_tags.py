@@ -108,19 +108,17 @@ TAG_PACKS: Dict[str, Dict[str, Any]] = {
 }
 
 
+# Flat, de-duplicated tag list in family order; TAG_FAMILIES is static, so
+# this is built once at import instead of on every lookup
+_ALL_TAGS: tuple[str, ...] = tuple(
+    dict.fromkeys(tag for family_tags in TAG_FAMILIES.values() for tag in family_tags)
+)
+_ALL_TAG_SET = frozenset(_ALL_TAGS)
+
+
 def get_all_tags() -> List[str]:
     """Get a flat list of all valid flavor tags."""
-    all_tags: List[str] = []
-    for family_tags in TAG_FAMILIES.values():
-        all_tags.extend(family_tags)
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_tags = []
-    for tag in all_tags:
-        if tag not in seen:
-            seen.add(tag)
-            unique_tags.append(tag)
-    return unique_tags
+    return list(_ALL_TAGS)
 
 
 def get_tags_by_family(family: str) -> List[str]:
@@ -140,5 +138,5 @@ def get_all_tag_packs() -> Dict[str, Dict[str, Any]]:
 
 def is_valid_tag(tag: str) -> bool:
     """Check if a tag is valid."""
-    return tag in get_all_tags()
+    return tag in _ALL_TAG_SET
 
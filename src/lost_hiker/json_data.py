@@ -0,0 +1,75 @@
+"""Shared JSON encoding and decoding for Lost Hiker data and saves.
+
+Everything goes through the standard library json module, so data files
+and saves are parsed and written the same way in every environment.
+"""
+
+from __future__ import annotations
+
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+
+def loads(data: bytes) -> Any:
+    """
+    Decode a JSON document from raw bytes.
+
+    Args:
+        data: UTF-8 encoded JSON bytes
+
+    Returns:
+        The decoded JSON value
+    """
+    return json.loads(data)
+
+
+def dumps_indented(value: Any) -> bytes:
+    """
+    Encode a value as two-space indented UTF-8 JSON bytes.
+
+    Args:
+        value: JSON-serializable value
+
+    Returns:
+        The encoded document
+    """
+    return json.dumps(value, indent=2).encode("utf-8")
+
+
+def read_json(path: Path) -> Any:
+    """
+    Read and decode a JSON file.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        The decoded JSON value
+    """
+    return loads(path.read_bytes())
+
+
+@lru_cache(maxsize=None)
+def _read_json_at(path_str: str, mtime_ns: int) -> Any:
+    """Parse a JSON file, memoized on its path and modification time."""
+    return read_json(Path(path_str))
+
+
+def read_json_cached(path: Path) -> Any:
+    """
+    Read a JSON file through a process-wide cache.
+
+    The file's mtime is part of the cache key, so an edited data file is
+    re-read on the next load instead of serving a stale catalog. The
+    returned value is shared between callers and must be treated as
+    read-only; copy it first if it needs to be modified.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        The decoded JSON value
+    """
+    return _read_json_at(str(path), path.stat().st_mtime_ns)
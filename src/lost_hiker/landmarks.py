@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import json
 import random
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Set
 
+from .json_data import read_json
 from .state import GameState
 from .forest_memory import (
     adjust_landmark_weights_based_on_memory,
@@ -217,8 +217,7 @@ class LandmarkCatalog:
 def load_landmark_catalog(data_dir: Path, filename: str = "landmarks_forest.json") -> LandmarkCatalog:
     """Load landmarks from a JSON file."""
     path = data_dir / filename
-    with path.open("r", encoding="utf-8") as handle:
-        raw = json.load(handle)
+    raw = read_json(path)
 
     landmarks = [
         Landmark.from_dict(entry)
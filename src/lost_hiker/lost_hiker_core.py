@@ -21,8 +21,8 @@ class DataRepo:
         if name in self.cache:
             return self.cache[name]
         path = os.path.join(self.data_dir, f"{name}.json")
-        with open(path, "r", encoding="utf-8") as f:
-            self.cache[name] = json.load(f)
+        with open(path, "rb") as f:
+            self.cache[name] = json.loads(f.read())
         return self.cache[name]
 
     # Convenience getters
@@ -103,8 +103,8 @@ class SaveSystem:
     def load(self) -> Optional[GameState]:
         if not os.path.exists(self.path):
             return None
-        with open(self.path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(self.path, "rb") as f:
+            data = json.loads(f.read())
         return GameState(**data)
 
 
@@ -2,21 +2,31 @@
 
 from __future__ import annotations
 
-import json
+import copy
+import curses
 import os
 import random
+import sys
+from bisect import insort
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import re
-from typing import Callable, Dict, Iterable, List, Optional, Pattern
+from functools import lru_cache, partial
+from typing import Callable, Dict, Iterable, List, Optional, Pattern, Sequence
 
 from .character import Character, build_character_from_race, sync_character_with_race
+from .dialogue import LazyDialogueCatalog
+from .encounters import EncounterEngine, load_encounter_definitions
 from .engine import Engine, UI
 from .events import load_event_pool
+from .json_data import read_json_cached
 from .flavor_tags import (
     get_all_tags,
     get_all_tag_packs,
     get_tag_pack,
 )
+from .npcs import load_npc_catalog
+from .runestones import load_runestone_definitions
 from .scenes import load_scene_catalog
 from .state import GameState, GameStateRepository
 from .seasons import load_season_config
@@ -24,6 +34,30 @@ from .landmarks import load_landmark_catalog
 from .cooking import load_cooking_catalog, load_food_items
 from . import ui_curses
 
+# Runs of characters that are not valid in a generated race_id slug
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
+@lru_cache(maxsize=64)
+def _build_highlight_regex(terms_key: frozenset[str]) -> Optional[Pattern[str]]:
+    """
+    Compile a case-insensitive alternation for the given highlight terms.
+
+    Keyed on the lowercased term set, so scenes that reuse the same terms in
+    any order or casing skip re-escaping and recompiling the pattern.
+
+    The cache is deliberately in-process only: re.Pattern objects pickle as
+    (pattern, flags) and are recompiled when unpickled, so persisting them
+    to disk between runs would add I/O without saving any compile work.
+    """
+    # Longest terms first so the alternation prefers the fullest match
+    ordered = sorted(terms_key, key=lambda term: (-len(term), term))
+    try:
+        pattern = "|".join(re.escape(term) for term in ordered)
+        return re.compile(pattern, re.IGNORECASE)
+    except re.error:
+        return None
+
 
 class ConsoleUI(UI):
     """Simple stdin/stdout user interface."""
@@ -32,147 +66,65 @@ class ConsoleUI(UI):
         self._highlight_terms: tuple[str, ...] = ()
 
     def heading(self, text: str) -> None:
-        print()
-        print(text)
-        print("-" * len(text))
+        sys.stdout.write(f"\n{text}\n{'-' * len(text)}\n")
 
     def echo(self, text: str) -> None:
         print(text, end="" if text.endswith("\n") else "\n")
 
+    def echo_lines(self, lines: Sequence[str]) -> None:
+        print(
+            "".join(line if line.endswith("\n") else line + "\n" for line in lines),
+            end="",
+        )
+
     def menu(self, prompt: str, options: List[str]) -> str:
-        print(prompt)
-        for idx, option in enumerate(options, start=1):
-            print(f"  {idx}. {option}")
+        # One write for the whole menu instead of a print per option
+        listing = "".join(
+            f"  {idx}. {option}\n" for idx, option in enumerate(options, start=1)
+        )
+        sys.stdout.write(f"{prompt}\n{listing}")
+        # Lowercase once per menu; setdefault keeps the first option on ties
+        by_name: Dict[str, str] = {}
+        for option in options:
+            by_name.setdefault(option.lower(), option)
         while True:
-            choice = input("> ").strip().lower()
+            choice = self._read_line("> ").lower()
             if choice.isdigit():
                 index = int(choice) - 1
                 if 0 <= index < len(options):
                     return options[index]
-            for option in options:
-                if choice == option.lower():
-                    return option
+            match = by_name.get(choice)
+            if match is not None:
+                return match
             print("Please choose by number or name.")
 
     def prompt(self, prompt: str) -> str:
-        return input(f"{prompt}\n> ").strip()
-
-    def set_highlights(self, terms: Iterable[str]) -> None:
-        self._highlight_terms = tuple(terms)
-
-
-class CursesUI(UI):
-    """
-    Curses-driven interface using the centralized ui_curses module.
-    
-    This class wraps the ui_curses module to provide the UI interface expected
-    by the game engine, while delegating all curses-specific work to ui_curses.
-    """
-
-    def __init__(self) -> None:
-        import curses
+        sys.stdout.write(prompt)
+        return self._read_line("\n> ")
 
-        self._curses = curses
-        self._screen = curses.initscr()
-        
-        # Initialize UI using centralized module (enforces 100×30 minimum)
-        self._windows = ui_curses.init_ui(self._screen)
-        
-        # Create ContentRenderer for content window
-        self._content_renderer = ui_curses.ContentRenderer(self._windows.content_win)
+    @staticmethod
+    def _read_line(marker: str) -> str:
+        """
+        Write an input marker and read one stripped line from stdin.
         
-        # Ensure initial screen state is visible
-        self._screen.refresh()
+        Reads sys.stdin directly rather than going through input(), which
+        is noticeably cheaper for piped or scripted sessions.
         
-        # Highlighting support (for syntax highlighting in text)
-        self._highlight_terms: tuple[str, ...] = ()
-        self._highlight_regex: Optional[Pattern[str]] = None
-        self._highlight_attr: Optional[int] = curses.A_BOLD
-        
-        try:
-            if curses.has_colors():
-                curses.start_color()
-                try:
-                    curses.use_default_colors()
-                except curses.error:
-                    pass
-                curses.init_pair(1, curses.COLOR_CYAN, -1)
-                self._highlight_attr = curses.color_pair(1) | curses.A_BOLD
-        except curses.error:
-            self._highlight_attr = curses.A_BOLD
+        Args:
+            marker: Text written just before reading, such as "> "
         
-        # Menu state
-        self._selected_index = 0
-        self._current_game_state: Optional[GameState] = None
-
-    def close(self) -> None:
-        """Clean up curses and restore terminal."""
-        curses = self._curses
-        curses.nocbreak()
-        self._windows.stdscr.keypad(False)
-        curses.echo()
-        try:
-            curses.curs_set(1)
-        except curses.error:
-            pass
-        curses.endwin()
-
-    def heading(self, text: str) -> None:
-        """Display a heading, clearing previous scene content."""
-        # Draw frame with borders first (this clears content window if requested)
-        self._draw_frame(clear_content=True)
-        # Clear the content renderer buffer
-        self._content_renderer.clear()
-        # Write heading text
-        heading_text = f"\n{text}\n{'-' * len(text)}\n"
-        self._content_renderer.write(heading_text)
-        # Ensure content window is visible
-        self._windows.content_win.refresh()
-
-    def echo(self, text: str) -> None:
-        """Add text to current scene output."""
-        # Don't clear content window - just draw frame to update header/borders
-        self._draw_frame(clear_content=False)
-        # Ensure text ends with newline
-        if not text.endswith("\n"):
-            text = text + "\n"
-        self._content_renderer.write(text)
-    
-    def clear_content(self) -> None:
-        """Clear the content window and reset renderer position."""
-        self._content_renderer.clear()
-
-    def scrollable_menu(self, prompt: str, options: List[str], initial_index: int = 0) -> str:
-        """
-        Console fallback for scrollable_menu; behaves the same as menu().
+        Returns:
+            The line without surrounding whitespace
         
-        Args:
-            prompt: Menu prompt text
-            options: List of option strings
-            initial_index: Unused for console UI (kept for API parity)
+        Raises:
+            EOFError: If stdin is exhausted, matching input()
         """
-        return self.menu(prompt, options)
-
-    def menu(self, prompt: str, options: List[str]) -> str:
-        """Display a numbered menu in the console."""
-        if not options:
-            return ""
-        print(prompt)
-        for idx, option in enumerate(options, start=1):
-            print(f"  {idx}. {option}")
-        while True:
-            choice = input("> ").strip().lower()
-            if choice.isdigit():
-                index = int(choice) - 1
-                if 0 <= index < len(options):
-                    return options[index]
-            for option in options:
-                if choice == option.lower():
-                    return option
-            print("Please choose by number or name.")
-
-    def prompt(self, prompt: str) -> str:
-        return input(f"{prompt}\n> ").strip()
+        sys.stdout.write(marker)
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        return line.strip()
 
     def set_highlights(self, terms: Iterable[str]) -> None:
         self._highlight_terms = tuple(terms)
@@ -187,9 +139,6 @@ class CursesUI(UI):
     """
 
     def __init__(self) -> None:
-        import curses
-
-        self._curses = curses
         self._screen = curses.initscr()
         
         # Initialize UI using centralized module (enforces 100×30 minimum)
@@ -203,7 +152,8 @@ class CursesUI(UI):
         
         # Highlighting support (for syntax highlighting in text)
         self._highlight_terms: tuple[str, ...] = ()
-        self._highlight_regex: Optional[Pattern[str]] = None
+        self._highlight_input: tuple[str, ...] = ()  # Raw terms last passed in
+        self._highlight_key: frozenset[str] = frozenset()  # Lowercased term set
         self._highlight_attr: Optional[int] = curses.A_BOLD
         
         try:
@@ -224,7 +174,6 @@ class CursesUI(UI):
 
     def close(self) -> None:
         """Clean up curses and restore terminal."""
-        curses = self._curses
         curses.nocbreak()
         self._windows.stdscr.keypad(False)
         curses.echo()
@@ -243,16 +192,28 @@ class CursesUI(UI):
         # Write heading text
         heading_text = f"\n{text}\n{'-' * len(text)}\n"
         self._content_renderer.write(heading_text)
-        # Ensure content window is visible
-        self._windows.content_win.refresh()
+        # Staged only; the next menu or prompt flushes everything at once
 
     def echo(self, text: str) -> None:
         """Add text to current scene output."""
-        # Don't clear content window - just draw frame to update header/borders
-        self._draw_frame(clear_content=False)
         # Ensure text ends with newline
         if not text.endswith("\n"):
             text = text + "\n"
+        # Staged only; a burst of echoes reaches the terminal in the single
+        # doupdate issued before the next menu or prompt waits for input.
+        # The frame is not redrawn here: every menu and prompt redraws it
+        # (header, border, cleared input row) right before that flush.
+        self._content_renderer.write(text)
+    
+    def echo_lines(self, lines: Sequence[str]) -> None:
+        """Add several echo texts to the scene output in one update."""
+        if not lines:
+            return
+        # Joining with an extra newline keeps the blank line each separate
+        # echo() would leave after its text
+        text = "\n".join(
+            line if line.endswith("\n") else line + "\n" for line in lines
+        )
         self._content_renderer.write(text)
     
     def clear_content(self) -> None:
@@ -275,7 +236,8 @@ class CursesUI(UI):
         self._selected_index = selected_index
         self._content_renderer.write_line(f"\nSelected: {chosen}")
         self._windows.menu_win.erase()
-        self._windows.menu_win.refresh()
+        self._windows.menu_win.noutrefresh()
+        # Flushed together with the follow-up output at the next input wait
         return chosen
 
     def menu(self, prompt: str, options: List[str]) -> str:
@@ -293,7 +255,8 @@ class CursesUI(UI):
         self._selected_index = selected_index
         self._content_renderer.write_line(f"  {selected_index + 1}. {chosen}")
         self._windows.menu_win.erase()
-        self._windows.menu_win.refresh()
+        self._windows.menu_win.noutrefresh()
+        # Flushed together with the follow-up output at the next input wait
         return chosen
 
     def _run_menu_view(
@@ -307,21 +270,49 @@ class CursesUI(UI):
         Drive a MenuView interaction loop and return the confirmed index.
         
         Keeps cursor movement, paging, and cancel handling consistent across
-        every menu screen.
+        every menu screen. Keys already waiting in the input buffer (held-down
+        arrow keys) are applied together before the menu is redrawn once.
         """
+        stdscr = self._windows.stdscr
         view = ui_curses.MenuView(options, title=prompt, selected_index=initial_index)
         view.render(self._windows.menu_win)
+        curses.doupdate()
         while True:
-            key = self._windows.stdscr.getch()
-            result = view.handle_key(key)
+            result = view.handle_key(stdscr.getch())
+            if result is None:
+                result = self._drain_menu_keys(view)
             if result is None:
                 view.render(self._windows.menu_win)
+                curses.doupdate()
                 continue
             if result == ui_curses.MENU_CANCEL:
                 return self._infer_cancel_index(options, fallback=view.selected_index)
             if isinstance(result, int):
                 return result
 
+    def _drain_menu_keys(self, view: ui_curses.MenuView) -> ui_curses.MenuHandleResult:
+        """
+        Apply every key already queued without blocking for more input.
+        
+        Args:
+            view: Menu receiving the queued keys
+        
+        Returns:
+            The first confirm/cancel result among the queued keys, or None
+        """
+        stdscr = self._windows.stdscr
+        stdscr.nodelay(True)
+        try:
+            while True:
+                key = stdscr.getch()
+                if key == -1:
+                    return None
+                result = view.handle_key(key)
+                if result is not None:
+                    return result
+        finally:
+            stdscr.nodelay(False)
+
     def _infer_cancel_index(self, options: List[str], *, fallback: int = 0) -> int:
         """
         Decide which option should be triggered by Esc/q cancellation.
@@ -363,9 +354,18 @@ class CursesUI(UI):
 
     def set_highlights(self, terms: Iterable[str]) -> None:
         """Set highlight terms for syntax highlighting."""
+        raw_terms = tuple(terms)
+        # Scenes re-send the same highlight set on most turns; nothing to redo
+        if raw_terms == self._highlight_input:
+            return
+        self._highlight_input = raw_terms
+        if not raw_terms:
+            self._highlight_terms = ()
+            self._highlight_key = frozenset()
+            return
         normalized: list[str] = []
         seen: set[str] = set()
-        for term in terms:
+        for term in raw_terms:
             if not term:
                 continue
             trimmed = term.strip()
@@ -377,49 +377,21 @@ class CursesUI(UI):
             seen.add(key)
             normalized.append(trimmed)
         self._highlight_terms = tuple(normalized)
-        if not self._highlight_terms:
-            self._highlight_regex = None
-        else:
-            # Create regex pattern for highlighting
-            pattern = "|".join(re.escape(term) for term in self._highlight_terms)
-            self._highlight_regex = re.compile(pattern, re.IGNORECASE)
-
-    def set_game_state(self, game_state: Optional[GameState]) -> None:
-        """Set the current game state for status bar display."""
-        self._current_game_state = game_state
+        # seen already holds the lowercased terms; the pattern itself is only
+        # compiled when _highlight_regex is first read
+        self._highlight_key = frozenset(seen)
 
-    def set_highlights(self, terms: Iterable[str]) -> None:
-        normalized: list[str] = []
-        seen: set[str] = set()
-        for term in terms:
-            if not term:
-                continue
-            trimmed = term.strip()
-            if not trimmed:
-                continue
-            key = trimmed.lower()
-            if key in seen:
-                continue
-            seen.add(key)
-            normalized.append(trimmed)
-        self._highlight_terms = tuple(normalized)
-        if not self._highlight_terms:
-            self._highlight_regex = None
-            return
-        try:
-            pattern = "|".join(
-                re.escape(term)
-                for term in sorted(self._highlight_terms, key=len, reverse=True)
-            )
-            self._highlight_regex = re.compile(pattern, re.IGNORECASE)
-        except re.error:
-            self._highlight_regex = None
+    @property
+    def _highlight_regex(self) -> Optional[Pattern[str]]:
+        """Compiled pattern for the current highlight terms, or None if there are none."""
+        if not self._highlight_key:
+            return None
+        return _build_highlight_regex(self._highlight_key)
 
 
 def load_races(data_dir: Path) -> Dict[str, Dict[str, object]]:
-    path = data_dir / "races.json"
-    with path.open("r", encoding="utf-8") as handle:
-        races = json.load(handle)
+    # Deep copy: callers add custom races to this dict during a session
+    races = copy.deepcopy(read_json_cached(data_dir / "races.json"))
     # Backward compatibility: map old "wolfkin" to new "wolf_kin"
     if "wolfkin" in races and "wolf_kin" not in races:
         races["wolf_kin"] = races["wolfkin"]
@@ -428,15 +400,11 @@ def load_races(data_dir: Path) -> Dict[str, Dict[str, object]]:
 
 
 def load_creatures(data_dir: Path) -> Dict[str, Dict[str, object]]:
-    path = data_dir / "creatures.json"
-    with path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+    return read_json_cached(data_dir / "creatures.json")
 
 
 def load_teas(data_dir: Path) -> Dict[str, Dict[str, object]]:
-    path = data_dir / "teas.json"
-    with path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+    return read_json_cached(data_dir / "teas.json")
 
 
 def apply_settings_to_state(state: GameState, settings: Dict[str, bool]) -> None:
@@ -455,77 +423,111 @@ def settings_menu(ui: UI, state: GameState) -> None:
     pred_status = "Enabled" if state.player_as_pred_enabled else "Disabled"
     
     ui.heading("Run Settings (Read-Only)")
-    ui.echo(f"Vore scenes: {vore_status}\n")
-    ui.echo(f"Player as predator: {pred_status}\n")
-    ui.echo(
-        "\nNote: These settings are set during character creation and cannot be changed mid-run.\n"
-    )
+    ui.echo_lines([
+        f"Vore scenes: {vore_status}\n",
+        f"Player as predator: {pred_status}\n",
+        "\nNote: These settings are set during character creation and cannot be changed mid-run.\n",
+    ])
     ui.prompt("Press Enter to return to main menu")
 
 
-def choose_race(ui: UI, races: Dict[str, Dict[str, object]]) -> Optional[str]:
-    """Choose a race, or return None for custom race."""
-    ordered = sorted(races.items())
-    display = []
-    for race_id, data in ordered:
+# (races dict, its size, menu entries, entry -> race id) from the last choose_race call
+_race_menu_cache: Optional[
+    tuple[Dict[str, Dict[str, object]], int, List[str], Dict[str, Optional[str]]]
+] = None
+
+
+def _race_menu(
+    races: Dict[str, Dict[str, object]],
+) -> tuple[List[str], Dict[str, Optional[str]]]:
+    """
+    Return the race menu entries and a map from entry back to race id.
+    
+    The races dict only changes during a session when a custom race is
+    added, which always grows it, so identity plus size detects staleness
+    and the sort and formatting are reused across menu reopens.
+    """
+    global _race_menu_cache
+    cached = _race_menu_cache
+    if cached is not None and cached[0] is races and cached[1] == len(races):
+        return cached[2], cached[3]
+    display: List[str] = []
+    race_id_by_entry: Dict[str, Optional[str]] = {}
+    for race_id, data in sorted(races.items()):
         name = data.get('name', race_id).title()
         description = data.get('description', data.get('summary', ''))
         if description:
-            display.append(f"{name} - {description}")
+            entry = f"{name} - {description}"
         else:
-            display.append(f"{name}")
-    display.append("Custom Race - Create your own race")
+            entry = f"{name}"
+        display.append(entry)
+        # Keep the first race for duplicate entries, as list.index did
+        race_id_by_entry.setdefault(entry, race_id)
+    custom_entry = "Custom Race - Create your own race"
+    display.append(custom_entry)
+    race_id_by_entry.setdefault(custom_entry, None)
+    _race_menu_cache = (races, len(races), display, race_id_by_entry)
+    return display, race_id_by_entry
+
+
+def choose_race(ui: UI, races: Dict[str, Dict[str, object]]) -> Optional[str]:
+    """Choose a race, or return None for custom race."""
+    display, race_id_by_entry = _race_menu(races)
     # Use scrollable_menu for large race lists
     if hasattr(ui, 'scrollable_menu'):
         selection = ui.scrollable_menu("Choose a race:", display)
     else:
         selection = ui.menu("Choose a race:", display)
-    index = display.index(selection)
-    if index < len(ordered):
-        return ordered[index][0]
-    return None  # Custom race
+    return race_id_by_entry[selection]  # None means custom race
+
+
+@lru_cache(maxsize=None)
+def _display_label(slug: str) -> str:
+    """Turn a snake_case id (flavor tag, archetype) into its title-cased label."""
+    return slug.replace("_", " ").title()
+
+
+# Menu label -> value for the fixed character option menus, in display order
+_BODY_TYPE_BY_LABEL: Dict[str, str] = {
+    opt.title(): opt for opt in ("humanoid", "taur", "naga", "quadruped")
+}
+_SIZE_BY_LABEL: Dict[str, str] = {
+    opt.title(): opt for opt in ("small", "medium", "large")
+}
+_ARCHETYPE_BY_LABEL: Dict[str, str] = {
+    _display_label(opt): opt
+    for opt in (
+        "forest_creature",
+        "cave_creature",
+        "river_creature",
+        "spiritborn",
+        "leyline_touched",
+        "beastfolk",
+    )
+}
 
 
 def choose_body_type(ui: UI, default: str = "humanoid") -> str:
     """Choose a body type."""
-    options = ["humanoid", "taur", "naga", "quadruped"]
-    display = [opt.title() for opt in options]
-    try:
-        default_idx = options.index(default.lower())
-        # Highlight default if UI supports it
-    except ValueError:
-        default_idx = 0
-    
-    selection = ui.menu(f"Choose body type (default: {default}):", display)
-    idx = display.index(selection)
-    return options[idx]
+    selection = ui.menu(
+        f"Choose body type (default: {default}):", list(_BODY_TYPE_BY_LABEL)
+    )
+    return _BODY_TYPE_BY_LABEL[selection]
 
 
 def choose_size(ui: UI, default: str = "medium") -> str:
     """Choose a size category."""
-    options = ["small", "medium", "large"]
-    display = [opt.title() for opt in options]
-    
-    selection = ui.menu(f"Choose size (default: {default}):", display)
-    idx = display.index(selection)
-    return options[idx]
+    selection = ui.menu(f"Choose size (default: {default}):", list(_SIZE_BY_LABEL))
+    return _SIZE_BY_LABEL[selection]
 
 
 def choose_archetype(ui: UI, default: str = "forest_creature") -> str:
     """Choose an ecology archetype."""
-    options = [
-        "forest_creature",
-        "cave_creature",
-        "river_creature",
-        "spiritborn",
-        "leyline_touched",
-        "beastfolk",
-    ]
-    display = [opt.replace("_", " ").title() for opt in options]
-    
-    selection = ui.menu(f"Choose archetype (default: {default.replace('_', ' ').title()}):", display)
-    idx = display.index(selection)
-    return options[idx]
+    selection = ui.menu(
+        f"Choose archetype (default: {_display_label(default)}):",
+        list(_ARCHETYPE_BY_LABEL),
+    )
+    return _ARCHETYPE_BY_LABEL[selection]
 
 
 def choose_flavor_tags(
@@ -533,12 +535,15 @@ def choose_flavor_tags(
 ) -> List[str]:
     """Choose flavor tags with optional tag pack preselection."""
     available_tags = get_all_tags()
-    display = [tag.replace("_", " ").title() for tag in available_tags]
+    display_by_tag = {tag: _display_label(tag) for tag in available_tags}
+    tag_by_display = {label: tag for tag, label in display_by_tag.items()}
     selected_tags: List[str] = []
     
     # Ask if they want to use a tag pack
-    ui.echo(f"\nChoose {min_tags}-{max_tags} flavor tags:\n")
-    ui.echo("Would you like to start with a tag pack?\n")
+    ui.echo_lines([
+        f"\nChoose {min_tags}-{max_tags} flavor tags:\n",
+        "Would you like to start with a tag pack?\n",
+    ])
     
     tag_packs = get_all_tag_packs()
     pack_options = []
@@ -552,17 +557,27 @@ def choose_flavor_tags(
         pack_selection = ui.scrollable_menu("Select a tag pack (or None for manual selection):", pack_options)
     else:
         pack_selection = ui.menu("Select a tag pack (or None for manual selection):", pack_options)
-    pack_idx = pack_options.index(pack_selection)
-    selected_pack_id = pack_ids[pack_idx]
+    pack_id_by_option = dict(zip(pack_options, pack_ids))
+    selected_pack_id = pack_id_by_option[pack_selection]
     
     # If a pack was selected (not "none"), prefill tags
     if selected_pack_id != "none":
         pack = get_tag_pack(selected_pack_id)
         if pack:
             selected_tags = list(pack["tags"])
-            ui.echo(f"\nSelected pack: {pack['name']}\n")
-            ui.echo(f"Prefilled tags: {', '.join([t.replace('_', ' ').title() for t in selected_tags])}\n")
-            ui.echo("You can add or remove tags to reach 2-4 total.\n")
+            ui.echo_lines([
+                f"\nSelected pack: {pack['name']}\n",
+                f"Prefilled tags: {', '.join(map(_display_label, selected_tags))}\n",
+                "You can add or remove tags to reach 2-4 total.\n",
+            ])
+    
+    # Unselected tags as (original index, tag), kept in original order and
+    # updated in place as tags are added or removed.
+    tag_positions = {tag: i for i, tag in enumerate(available_tags)}
+    selected_set = set(selected_tags)
+    available = [
+        (i, tag) for i, tag in enumerate(available_tags) if tag not in selected_set
+    ]
     
     # Manual tag selection/adjustment
     while len(selected_tags) < min_tags or (
@@ -570,15 +585,10 @@ def choose_flavor_tags(
     ):
         # Show current selection
         if selected_tags:
-            ui.echo(f"\nSelected: {', '.join([t.replace('_', ' ').title() for t in selected_tags])} ({len(selected_tags)}/{max_tags})\n")
+            ui.echo(f"\nSelected: {', '.join(map(_display_label, selected_tags))} ({len(selected_tags)}/{max_tags})\n")
         
         # Build available options
-        available_display = []
-        available_indices = []
-        for i, tag in enumerate(available_tags):
-            if tag not in selected_tags:
-                available_display.append(display[i])
-                available_indices.append(i)
+        available_display = [display_by_tag[tag] for _, tag in available]
         
         # Add option to remove tags if we have any
         if selected_tags:
@@ -599,45 +609,42 @@ def choose_flavor_tags(
         
         if selection == "Remove a tag":
             # Show tags to remove
-            remove_options = [t.replace("_", " ").title() for t in selected_tags]
+            remove_options = [_display_label(t) for t in selected_tags]
             # Use scrollable_menu for remove menu if list is large
             if hasattr(ui, 'scrollable_menu') and len(remove_options) > 6:
                 remove_selection = ui.scrollable_menu("Remove which tag?", remove_options)
             else:
                 remove_selection = ui.menu("Remove which tag?", remove_options)
-            remove_idx = remove_options.index(remove_selection)
-            removed_tag = selected_tags.pop(remove_idx)
-            ui.echo(f"Removed: {removed_tag.replace('_', ' ').title()}\n")
+            position_by_option = {option: i for i, option in enumerate(remove_options)}
+            removed_tag = selected_tags.pop(position_by_option[remove_selection])
+            if removed_tag in tag_positions:
+                insort(available, (tag_positions[removed_tag], removed_tag))
+            ui.echo(f"Removed: {_display_label(removed_tag)}\n")
             continue
         
-        idx = available_display.index(selection)
-        if idx < len(available_indices):
-            tag_idx = available_indices[idx]
-            selected_tags.append(available_tags[tag_idx])
-            ui.echo(f"Added: {display[tag_idx]}\n")
+        chosen_tag = tag_by_display.get(selection)
+        if chosen_tag is not None:
+            available.remove((tag_positions[chosen_tag], chosen_tag))
+            selected_tags.append(chosen_tag)
+            ui.echo(f"Added: {selection}\n")
     
     # Ensure we have at least min_tags
     if len(selected_tags) < min_tags:
         ui.echo(f"\nWarning: You have {len(selected_tags)} tags, minimum is {min_tags}.\n")
         # Force selection of remaining tags
         while len(selected_tags) < min_tags:
-            available_display = []
-            available_indices = []
-            for i, tag in enumerate(available_tags):
-                if tag not in selected_tags:
-                    available_display.append(display[i])
-                    available_indices.append(i)
+            available_display = [display_by_tag[tag] for _, tag in available]
             
             # Use scrollable_menu for large tag lists
             if hasattr(ui, 'scrollable_menu') and len(available_display) > 6:
                 selection = ui.scrollable_menu(f"Select tag ({len(selected_tags) + 1}/{min_tags}):", available_display)
             else:
                 selection = ui.menu(f"Select tag ({len(selected_tags) + 1}/{min_tags}):", available_display)
-            idx = available_display.index(selection)
-            if idx < len(available_indices):
-                tag_idx = available_indices[idx]
-                selected_tags.append(available_tags[tag_idx])
-                ui.echo(f"Added: {display[tag_idx]}\n")
+            chosen_tag = tag_by_display.get(selection)
+            if chosen_tag is not None:
+                available.remove((tag_positions[chosen_tag], chosen_tag))
+                selected_tags.append(chosen_tag)
+                ui.echo(f"Added: {selection}\n")
     
     return selected_tags
 
@@ -655,7 +662,7 @@ def create_custom_race(ui: UI, races: Dict[str, Dict[str, object]]) -> tuple[str
             ui.echo("Race name cannot be empty.\n")
     
     # Generate race_id from name
-    race_id = "custom_" + re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_")
+    race_id = "custom_" + _SLUG_RE.sub("_", name.lower()).strip("_")
     
     # Ensure unique race_id
     base_race_id = race_id
@@ -815,8 +822,19 @@ def show_character_summary(
         ui.echo(summary + "\n")
 
 
+@lru_cache(maxsize=1)
+def _console_ui_requested() -> bool:
+    """
+    Return True when LOST_HIKER_NO_CURSES forces the console UI.
+
+    Read once per process; the terminal setup itself (initscr and its
+    terminfo lookup) only happens when CursesUI is actually constructed.
+    """
+    return os.environ.get("LOST_HIKER_NO_CURSES", "").lower() == "1"
+
+
 def build_ui() -> tuple[UI, Optional[Callable[[], None]]]:
-    if os.environ.get("LOST_HIKER_NO_CURSES", "").lower() == "1":
+    if _console_ui_requested():
         return ConsoleUI(), None
     try:
         ui = CursesUI()
@@ -826,7 +844,14 @@ def build_ui() -> tuple[UI, Optional[Callable[[], None]]]:
         return ConsoleUI(), None
 
 
+@lru_cache(maxsize=1)
 def resolve_paths() -> tuple[Path, Path]:
+    """
+    Return the bundled data directory and the save file path.
+
+    Cached because the engine and save migration call back into this after
+    startup, and Path.resolve() goes to the filesystem each time.
+    """
     package_dir = Path(__file__).resolve().parent
     project_root = package_dir.parent.parent
     data_dir = package_dir / "data"
@@ -834,10 +859,51 @@ def resolve_paths() -> tuple[Path, Path]:
     return data_dir, save_path
 
 
+# Dialogue files merged into the single catalog the engine uses, in load order
+_DIALOGUE_FILES = (
+    "dialogue_forest.json",
+    "dialogue_echo.json",
+    "dialogue_naiad.json",
+    "dialogue_druid.json",
+    "dialogue_fisher.json",
+    "dialogue_astrin.json",
+)
+
+
+# Main menu labels mapped to the action they trigger, in display order.
+# ui.menu returns the chosen label verbatim, so no case folding is needed.
+_MAIN_ACTIONS: Dict[str, str] = {
+    "New Game": "new",
+    "Continue": "continue",
+    "Settings": "settings",
+    "Quit": "quit",
+}
+
+
+def _build_rng() -> random.Random:
+    """
+    Create the engine's random generator from LOST_HIKER_SEED.
+    
+    Numeric seeds are used as integers so a given value reproduces the same
+    run regardless of string hashing; any other value seeds from the string.
+    Helper modules that still draw from the global generator get a seed
+    taken from the dedicated one, so seeded runs stay reproducible without
+    the two streams producing the same sequence of rolls.
+    
+    Returns:
+        A dedicated Random instance, unseeded when the variable is not set
+    """
+    seed_str = os.environ.get("LOST_HIKER_SEED")
+    if not seed_str:
+        return random.Random()
+    seed: int | str = int(seed_str) if seed_str.isdigit() else seed_str
+    rng = random.Random(seed)
+    random.seed(rng.getrandbits(64))
+    return rng
+
+
 def main() -> None:
-    seed = os.environ.get("LOST_HIKER_SEED")
-    if seed is not None:
-        random.seed(seed)
+    rng = _build_rng()
     data_dir, save_path = resolve_paths()
     repo = GameStateRepository(save_path)
     ui, closer = build_ui()
@@ -846,50 +912,68 @@ def main() -> None:
         "player_as_pred_enabled": False,
     }
     try:
-        event_pool = load_event_pool(data_dir, "events_forest.json")
-        scenes = load_scene_catalog(data_dir)
-        creatures = load_creatures(data_dir)
-        teas = load_teas(data_dir)
-        races = load_races(data_dir)
-        season_config = load_season_config(data_dir)
-        landmarks = load_landmark_catalog(data_dir, "landmarks_forest.json")
-        cooking = load_cooking_catalog(data_dir)
-        food_items = load_food_items(data_dir)
-        from .runestones import load_runestone_definitions
-        from .encounters import load_encounter_definitions, EncounterEngine
-        from .npcs import load_npc_catalog
-        from .dialogue import load_dialogue_catalog
-        runestone_defs = load_runestone_definitions(data_dir, "runestones_forest.json")
-        encounter_defs = load_encounter_definitions(data_dir, "encounters_forest.json")
+        # Catalog loads are independent file reads; overlap them on a thread pool
+        load_tasks: Dict[str, Callable[[], object]] = {
+            "event_pool": lambda: load_event_pool(data_dir, "events_forest.json"),
+            "scenes": lambda: load_scene_catalog(data_dir),
+            "creatures": lambda: load_creatures(data_dir),
+            "teas": lambda: load_teas(data_dir),
+            "races": lambda: load_races(data_dir),
+            "season_config": lambda: load_season_config(data_dir),
+            "landmarks": lambda: load_landmark_catalog(data_dir, "landmarks_forest.json"),
+            "cooking": lambda: load_cooking_catalog(data_dir),
+            "food_items": lambda: load_food_items(data_dir),
+            "runestone_defs": lambda: load_runestone_definitions(data_dir, "runestones_forest.json"),
+            "encounter_defs": lambda: load_encounter_definitions(data_dir, "encounters_forest.json"),
+            "npc_catalog": lambda: load_npc_catalog(data_dir, "npcs_forest.json"),
+        }
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {key: executor.submit(task) for key, task in load_tasks.items()}
+            results = {key: future.result() for key, future in futures.items()}
+        event_pool = results["event_pool"]
+        scenes = results["scenes"]
+        creatures = results["creatures"]
+        teas = results["teas"]
+        races = results["races"]
+        season_config = results["season_config"]
+        landmarks = results["landmarks"]
+        cooking = results["cooking"]
+        food_items = results["food_items"]
+        runestone_defs = results["runestone_defs"]
+        encounter_defs = results["encounter_defs"]
         encounter_engine = EncounterEngine(encounter_defs) if encounter_defs else None
-        npc_catalog = load_npc_catalog(data_dir, "npcs_forest.json")
-        # Load dialogue catalogs and merge them
-        forest_dialogue = load_dialogue_catalog(data_dir, "dialogue_forest.json")
-        echo_dialogue = load_dialogue_catalog(data_dir, "dialogue_echo.json")
-        naiad_dialogue = load_dialogue_catalog(data_dir, "dialogue_naiad.json")
-        druid_dialogue = load_dialogue_catalog(data_dir, "dialogue_druid.json")
-        fisher_dialogue = load_dialogue_catalog(data_dir, "dialogue_fisher.json")
-        astrin_dialogue = load_dialogue_catalog(data_dir, "dialogue_astrin.json")
-        # Merge dialogue nodes from all catalogs
-        from .dialogue import DialogueCatalog
-        all_nodes = (
-            list(forest_dialogue.nodes)
-            + list(echo_dialogue.nodes)
-            + list(naiad_dialogue.nodes)
-            + list(druid_dialogue.nodes)
-            + list(fisher_dialogue.nodes)
-            + list(astrin_dialogue.nodes)
+        npc_catalog = results["npc_catalog"]
+        # Dialogue is only read once a conversation starts, so Quit and
+        # Settings from the main menu never parse it
+        dialogue_catalog = LazyDialogueCatalog(data_dir, _DIALOGUE_FILES)
+        # Everything but the game state is fixed for the session, so bind it once
+        make_engine = partial(
+            Engine,
+            ui=ui,
+            runestone_defs=runestone_defs,
+            repo=repo,
+            events=event_pool,
+            scenes=scenes,
+            creatures=creatures,
+            teas=teas,
+            season_config=season_config,
+            landmarks=landmarks,
+            cooking=cooking,
+            food_items=food_items,
+            encounter_engine=encounter_engine,
+            npc_catalog=npc_catalog,
+            dialogue_catalog=dialogue_catalog,
+            rng=rng,
         )
-        dialogue_catalog = DialogueCatalog(all_nodes)
-        menu_options = ["New Game", "Continue", "Settings", "Quit"]
+        menu_options = list(_MAIN_ACTIONS)
         # Initialize main menu screen
         ui.heading("Lost Hiker")
         while True:
             choice = ui.menu("Main Menu", menu_options)
-            choice_lower = choice.lower()
-            if choice_lower == "quit":
+            action = _MAIN_ACTIONS.get(choice)
+            if action == "quit":
                 break
-            if choice_lower == "new game":
+            if action == "new":
                 character, vore_enabled, player_as_pred_enabled = create_character(ui, races)
                 show_character_summary(ui, character, races[character.race_id])
                 state = repo.create_new(character)
@@ -902,7 +986,7 @@ def main() -> None:
                 settings_snapshot["vore_enabled"] = vore_enabled
                 settings_snapshot["player_as_pred_enabled"] = player_as_pred_enabled
             else:
-                if choice_lower == "settings":
+                if action == "settings":
                     # For settings menu, we need a state to show current settings
                     # Load existing save if available, otherwise show defaults
                     temp_state = repo.load()
@@ -926,23 +1010,7 @@ def main() -> None:
                 # Load vore settings from save (already in state)
                 settings_snapshot["vore_enabled"] = state.vore_enabled
                 settings_snapshot["player_as_pred_enabled"] = state.player_as_pred_enabled
-            engine = Engine(
-                state=state,
-                ui=ui,
-                runestone_defs=runestone_defs,
-                repo=repo,
-                events=event_pool,
-                scenes=scenes,
-                creatures=creatures,
-                teas=teas,
-                season_config=season_config,
-                landmarks=landmarks,
-                cooking=cooking,
-                food_items=food_items,
-                encounter_engine=encounter_engine,
-                npc_catalog=npc_catalog,
-                dialogue_catalog=dialogue_catalog,
-            )
+            engine = make_engine(state=state)
             # Set game state in UI for status bar display
             if isinstance(ui, CursesUI):
                 ui.set_game_state(state)
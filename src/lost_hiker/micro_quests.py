@@ -3,13 +3,41 @@
 from __future__ import annotations
 
 import random
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from .character import TimedModifier
+from .echo import is_echo_present_at_glade
+from .echo_vore import can_echo_vore_trigger
+from .rapport import change_rapport, get_rapport, get_rapport_tier
+from .vore import is_vore_enabled
 
 if TYPE_CHECKING:
     from .state import GameState
     from .ui import UI
 
 
+def _forest_memory_mods() -> List[Dict[str, Dict[str, float]]]:
+    """
+    Build the +1 forest_memory spec used by the firefly, sketch and ritual buffs.
+
+    Each buff gets its own dicts, so changing one active modifier can never
+    leak into the others.
+    """
+    return [{"add": {"forest_memory": 1.0}}]
+
+# Items Echo can bring back from a favor run
+_ECHO_FAVOR_RESOURCES = ("forest_berries", "mint", "trail_nuts")
+
+
+def _stamina_max(state: GameState) -> float:
+    """Current stamina_max including active timed modifiers."""
+    return state.character.get_stat(
+        "stamina_max",
+        timed_modifiers=state.timed_modifiers,
+        current_day=state.day,
+    )
+
+
 def check_blue_fireflies_event(state: GameState) -> bool:
     """
     Check if Blue Fireflies event should trigger.
@@ -27,19 +55,18 @@ def check_blue_fireflies_event(state: GameState) -> bool:
     Returns:
         True if event should trigger
     """
-    if state.current_season != "spring":
-        return False
-    if state.time_of_day != "Night":
+    # Optional: only trigger once per playthrough. Checked before the random
+    # roll so a seen event no longer consumes a draw on every glade night.
+    if state.npc_state.get("blue_fireflies_seen", False):
         return False
     if state.active_zone != "glade":
         return False
-    # Low random chance (3% base)
-    if random.random() > 0.03:
+    if state.current_season != "spring":
         return False
-    # Optional: only trigger once per playthrough
-    if state.npc_state.get("blue_fireflies_seen", False):
+    if state.time_of_day != "Night":
         return False
-    return True
+    # Low random chance (3% base)
+    return random.random() <= 0.03
 
 
 def trigger_blue_fireflies_event(state: GameState, ui: UI) -> None:
@@ -53,9 +80,6 @@ def trigger_blue_fireflies_event(state: GameState, ui: UI) -> None:
         state: Current game state
         ui: UI interface for displaying messages
     """
-    from .echo import is_echo_present_at_glade
-    from .vore import is_vore_enabled
-    from .echo_vore import can_echo_vore_trigger, trigger_echo_belly_shelter
     
     # Show the event scene
     ui.echo(
@@ -82,11 +106,10 @@ def trigger_blue_fireflies_event(state: GameState, ui: UI) -> None:
         )
     
     # Optional small buff (forest_memory or rapport)
-    from .character import TimedModifier
     state.timed_modifiers.append(
         TimedModifier(
             source="blue_fireflies",
-            modifiers=[{"add": {"forest_memory": 1.0}}],
+            modifiers=_forest_memory_mods(),
             expires_on_day=state.day + 3,  # Lasts 3 days
         )
     )
@@ -122,7 +145,6 @@ def check_echo_checkin(state: GameState) -> bool:
     Returns:
         True if check-in should trigger
     """
-    from .echo import is_echo_present_at_glade
     
     if state.active_zone != "glade":
         return False
@@ -134,13 +156,10 @@ def check_echo_checkin(state: GameState) -> bool:
     if last_checkin == state.day:
         return False
     
-    # Check for rough day conditions (low stamina or condition > 0)
-    stamina_max = state.character.get_stat(
-        "stamina_max",
-        timed_modifiers=state.timed_modifiers,
-        current_day=state.day,
-    )
-    if state.stamina < stamina_max * 0.5 or state.condition > 0:
+    # Check for rough day conditions (condition > 0 or low stamina); the
+    # condition test comes first so get_stat only walks the timed modifiers
+    # when it is actually needed
+    if state.condition > 0 or state.stamina < _stamina_max(state) * 0.5:
         # 20% chance when conditions are met
         if random.random() < 0.2:
             return True
@@ -156,8 +175,6 @@ def trigger_echo_checkin(state: GameState, ui: UI) -> None:
         state: Current game state
         ui: UI interface for displaying messages
     """
-    from .dialogue import start_dialogue, get_current_dialogue_text, get_available_options
-    from .dialogue import select_option, DialogueSession
     
     ui.echo(
         "[RADIO] You seem tired. Rough day? The forest can be harsh, but you're safe here. "
@@ -165,16 +182,10 @@ def trigger_echo_checkin(state: GameState, ui: UI) -> None:
     )
     
     # Small stamina or rapport boost
-    from .rapport import change_rapport
     change_rapport(state, "echo", 1)
     
     # Small stamina boost
-    stamina_max = state.character.get_stat(
-        "stamina_max",
-        timed_modifiers=state.timed_modifiers,
-        current_day=state.day,
-    )
-    state.stamina = min(stamina_max, state.stamina + 1.0)
+    state.stamina = min(_stamina_max(state), state.stamina + 1.0)
     
     # Mark as checked in today
     state.npc_state["echo_checkin_last_day"] = state.day
@@ -197,8 +208,6 @@ def check_echo_favor(state: GameState) -> bool:
     Returns:
         True if favor event should trigger
     """
-    from .echo import is_echo_present_at_glade
-    from .rapport import get_rapport, get_rapport_tier
     
     if state.active_zone != "glade":
         return False
@@ -237,8 +246,7 @@ def trigger_echo_favor(state: GameState, ui: UI) -> None:
     )
     
     # Add small random resource
-    resources = ["forest_berries", "mint", "trail_nuts"]
-    resource = random.choice(resources)
+    resource = random.choice(_ECHO_FAVOR_RESOURCES)
     state.inventory.append(resource)
     ui.echo(f"You receive: {resource.replace('_', ' ').title()}.\n")
     
@@ -253,14 +261,13 @@ def apply_hermit_sketch_buff(state: GameState) -> None:
     Args:
         state: Current game state
     """
-    from .character import TimedModifier
     
     if state.npc_state.get("hermit_sketch_given", False):
         # Add temporary forest_memory modifier (lasts 3 days)
         state.timed_modifiers.append(
             TimedModifier(
                 source="hermit_sketch",
-                modifiers=[{"add": {"forest_memory": 1.0}}],
+                modifiers=_forest_memory_mods(),
                 expires_on_day=state.day + 3,
             )
         )
@@ -273,13 +280,12 @@ def apply_druid_night_ritual_buff(state: GameState) -> None:
     Args:
         state: Current game state
     """
-    from .character import TimedModifier
     
     # Add one-night forest_memory modifier
     state.timed_modifiers.append(
         TimedModifier(
             source="druid_night_ritual",
-            modifiers=[{"add": {"forest_memory": 1.0}}],
+            modifiers=_forest_memory_mods(),
             expires_on_day=state.day + 1,  # Lasts until next day
         )
     )
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import random
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional
 
 from .state import GameState
 from .npcs import NPC, NPCCatalog
@@ -11,6 +11,75 @@ from .forest_act1 import get_forest_act1_progress_summary
 from .runestones import get_repaired_runestone_count
 
 
+def _echo_appears(state: GameState, landmark_id: str) -> bool:
+    # Echo is always at the Glade
+    return landmark_id == "glade" and state.echo_present_at_glade
+
+
+def _hermit_appears(state: GameState, landmark_id: str) -> bool:
+    # Hermit is a wandering NPC, appears at shallow/mid-forest landmarks
+    # More likely in early days, but can appear later
+    if state.day <= 10:
+        # Higher chance in first 10 days
+        return random.random() < 0.6
+    # Still possible later, but less common
+    return random.random() < 0.3
+
+
+def _naiad_appears(state: GameState, landmark_id: str) -> bool:
+    # Naiad only appears after at least one runestone is repaired
+    repaired_count = get_repaired_runestone_count(state)
+    if repaired_count < 1:
+        return False
+    # After first repair, has a chance to appear
+    return random.random() < 0.5
+
+
+def _druid_appears(state: GameState, landmark_id: str) -> bool:
+    # Druid appears at Verdant Hollow and Whispering Hollow
+    # Moderate chance when visiting
+    return random.random() < 0.4
+
+
+def _fisher_appears(state: GameState, landmark_id: str) -> bool:
+    # Fisher appears at creek landmarks during daytime
+    if state.time_of_day not in ("Day", "Dawn", "Dusk"):
+        return False
+    # Good chance during daytime
+    return random.random() < 0.5
+
+
+def _astrin_appears(state: GameState, landmark_id: str) -> bool:
+    # Astrin's appearance depends on her status
+    astrin_status = state.npc_state.get("astrin_status", "missing")
+    
+    if astrin_status == "missing":
+        # Can be found at Sunken Spring or Verdant Hollow
+        if landmark_id in ("sunken_spring", "verdant_hollow"):
+            return random.random() < 0.4
+        return False
+    elif astrin_status == "found":
+        # After being found but before reaching Glade, she's in transit
+        # Don't appear at landmarks
+        return False
+    elif astrin_status == "at_glade":
+        # At the Glade permanently
+        return landmark_id == "glade"
+    
+    return False
+
+
+# Per-NPC appearance rules, looked up by npc_id instead of an elif chain
+_APPEARANCE_RULES: Dict[str, Callable[[GameState, str], bool]] = {
+    "echo": _echo_appears,
+    "forest_hermit": _hermit_appears,
+    "naiad": _naiad_appears,
+    "druid": _druid_appears,
+    "fisher": _fisher_appears,
+    "astrin": _astrin_appears,
+}
+
+
 def should_npc_appear(
     npc: NPC,
     state: GameState,
@@ -30,63 +99,16 @@ def should_npc_appear(
     # Check if NPC is associated with this landmark
     if landmark_id not in npc.landmark_ids:
         return False
-    
-    # Special handling for each NPC
-    if npc.npc_id == "echo":
-        # Echo is always at the Glade
-        return landmark_id == "glade" and state.echo_present_at_glade
-    
-    elif npc.npc_id == "forest_hermit":
-        # Hermit is a wandering NPC, appears at shallow/mid-forest landmarks
-        # More likely in early days, but can appear later
-        if state.day <= 10:
-            # Higher chance in first 10 days
-            return random.random() < 0.6
-        else:
-            # Still possible later, but less common
-            return random.random() < 0.3
-    
-    elif npc.npc_id == "naiad":
-        # Naiad only appears after at least one runestone is repaired
-        repaired_count = get_repaired_runestone_count(state)
-        if repaired_count < 1:
-            return False
-        # After first repair, has a chance to appear
-        return random.random() < 0.5
-    
-    elif npc.npc_id == "druid":
-        # Druid appears at Verdant Hollow and Whispering Hollow
-        # Moderate chance when visiting
-        return random.random() < 0.4
-    
-    elif npc.npc_id == "fisher":
-        # Fisher appears at creek landmarks during daytime
-        if state.time_of_day not in ("Day", "Dawn", "Dusk"):
-            return False
-        # Good chance during daytime
-        return random.random() < 0.5
-    
-    elif npc.npc_id == "astrin":
-        # Astrin's appearance depends on her status
-        astrin_status = state.npc_state.get("astrin_status", "missing")
-        
-        if astrin_status == "missing":
-            # Can be found at Sunken Spring or Verdant Hollow
-            if landmark_id in ("sunken_spring", "verdant_hollow"):
-                return random.random() < 0.4
-            return False
-        elif astrin_status == "found":
-            # After being found but before reaching Glade, she's in transit
-            # Don't appear at landmarks
-            return False
-        elif astrin_status == "at_glade":
-            # At the Glade permanently
-            return landmark_id == "glade"
-        
-        return False
-    
-    # Default: NPC appears if associated with landmark
-    return True
+    return _passes_appearance_rule(npc, state, landmark_id)
+
+
+def _passes_appearance_rule(npc: NPC, state: GameState, landmark_id: str) -> bool:
+    """Apply the NPC's appearance rule; assumes it is linked to the landmark."""
+    rule = _APPEARANCE_RULES.get(npc.npc_id)
+    if rule is None:
+        # Default: NPC appears if associated with landmark
+        return True
+    return rule(state, landmark_id)
 
 
 def get_present_npcs(
@@ -105,14 +127,24 @@ def get_present_npcs(
     Returns:
         List of NPCs that should appear at this landmark
     """
-    all_npcs = npc_catalog.get_npcs_at_landmark(landmark_id)
-    present = []
-    
-    for npc in all_npcs:
-        if should_npc_appear(npc, state, landmark_id):
-            present.append(npc)
-    
-    return present
+    # The catalog's per-landmark index already guarantees every candidate is
+    # linked to this landmark, so only the appearance rules need checking
+    return [
+        npc
+        for npc in npc_catalog.get_npcs_at_landmark(landmark_id)
+        if _passes_appearance_rule(npc, state, landmark_id)
+    ]
+
+
+# Presence line shown when each known NPC is at a landmark
+_PRESENCE_DESCRIPTIONS: Dict[str, str] = {
+    "echo": "Echo is here, her massive coils resting near the charred tree.",
+    "forest_hermit": "Alder sits by a small fire, their weathered face calm and watchful.",
+    "naiad": "The Naiad's form shimmers in the spring, mist and water coalescing into a graceful figure.",
+    "druid": "The Druid examines the mushrooms, their expression troubled.",
+    "fisher": "A lizard-folk crouches by the water's edge, examining the creek with practiced efficiency.",
+    "astrin": "Astrin is here, organizing her samples and setting up a small workspace.",
+}
 
 
 def get_npc_presence_description(npc: NPC, landmark_id: str) -> str:
@@ -126,19 +158,4 @@ def get_npc_presence_description(npc: NPC, landmark_id: str) -> str:
     Returns:
         A description string
     """
-    if npc.npc_id == "echo":
-        return "Echo is here, her massive coils resting near the charred tree."
-    elif npc.npc_id == "forest_hermit":
-        return "Alder sits by a small fire, their weathered face calm and watchful."
-    elif npc.npc_id == "naiad":
-        return "The Naiad's form shimmers in the spring, mist and water coalescing into a graceful figure."
-    elif npc.npc_id == "druid":
-        return "The Druid examines the mushrooms, their expression troubled."
-    elif npc.npc_id == "fisher":
-        return "A lizard-folk crouches by the water's edge, examining the creek with practiced efficiency."
-    elif npc.npc_id == "astrin":
-        astrin_status = None  # Will be checked in calling code
-        return "Astrin is here, organizing her samples and setting up a small workspace."
-    
-    return f"{npc.name} is here."
-
+    return _PRESENCE_DESCRIPTIONS.get(npc.npc_id) or f"{npc.name} is here."
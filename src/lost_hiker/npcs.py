@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from .json_data import read_json
+
 
 @dataclass(frozen=True)
 class NPC:
@@ -15,7 +16,7 @@ class NPC:
     npc_id: str
     name: str
     description: str
-    landmark_ids: tuple[str, ...]
+    landmark_ids: frozenset[str]  # Set for O(1) membership checks on landmark entry
     tags: tuple[str, ...]
 
     @classmethod
@@ -23,9 +24,9 @@ class NPC:
         """Create an NPC from JSON data."""
         landmark_ids = data.get("landmark_ids", [])
         if isinstance(landmark_ids, list):
-            landmark_ids = tuple(str(lm) for lm in landmark_ids)
+            landmark_ids = frozenset(str(lm) for lm in landmark_ids)
         else:
-            landmark_ids = ()
+            landmark_ids = frozenset()
         tags = data.get("tags", [])
         if isinstance(tags, list):
             tags = tuple(str(t) for t in tags)
@@ -49,9 +50,7 @@ class NPCCatalog:
         self._by_landmark: Dict[str, List[NPC]] = {}
         for npc in npcs:
             for landmark_id in npc.landmark_ids:
-                if landmark_id not in self._by_landmark:
-                    self._by_landmark[landmark_id] = []
-                self._by_landmark[landmark_id].append(npc)
+                self._by_landmark.setdefault(landmark_id, []).append(npc)
 
     def get(self, npc_id: str) -> Optional[NPC]:
         """Get an NPC by ID."""
@@ -68,8 +67,7 @@ def load_npc_catalog(data_dir: Path, filename: str = "npcs_forest.json") -> NPCC
     if not path.exists():
         return NPCCatalog([])
     
-    with path.open("r", encoding="utf-8") as handle:
-        raw = json.load(handle)
+    raw = read_json(path)
     
     npcs = [
         NPC.from_dict(entry)
@@ -8,12 +8,12 @@ items, or quest progress.
 
 from __future__ import annotations
 
-import json
 import random
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from .json_data import read_json
 from .state import GameState
 from .character import Character
 from .time_of_day import get_time_of_day
@@ -172,8 +172,7 @@ class RareLoreEventSystem:
         if not path.exists():
             return cls([])
         
-        with path.open("r", encoding="utf-8") as handle:
-            data = json.load(handle)
+        data = read_json(path)
         
         events = [
             RareLoreEvent.from_dict(entry)
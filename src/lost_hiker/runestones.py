@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-import json
 import random
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from .json_data import read_json
 from .state import GameState
 from .landmarks import Landmark
 
@@ -353,8 +353,7 @@ def load_runestone_definitions(data_dir: Path, filename: str = "runestones_fores
     path = data_dir / filename
     if not path.exists():
         return {}
-    with path.open("r", encoding="utf-8") as handle:
-        raw = json.load(handle)
+    raw = read_json(path)
     runestones = {}
     for entry in raw.get("runestones", []):
         runestone_id = entry.get("id")
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-import json
 import random
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Iterable, Mapping, Optional, Tuple
 
+from .json_data import read_json_cached
+
 
 @dataclass(frozen=True)
 class Examinable:
@@ -80,8 +81,7 @@ class SceneCatalog:
 def load_scene_catalog(data_dir: Path) -> SceneCatalog:
     """Load scene data from JSON."""
     path = data_dir / "scenes.json"
-    with path.open("r", encoding="utf-8") as handle:
-        raw = json.load(handle)
+    raw = read_json_cached(path)
 
     scenes: Dict[str, Scene] = {}
     for zone_id, payload in raw.items():
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import TYPE_CHECKING, Dict, List, Optional
 
+from .json_data import read_json
+
 if TYPE_CHECKING:
     from .state import GameState
 
@@ -53,8 +54,7 @@ class SeasonConfig:
 def load_season_config(data_dir: Path) -> SeasonConfig:
     """Load season configuration from JSON file."""
     path = data_dir / "seasons.json"
-    with path.open("r", encoding="utf-8") as handle:
-        data = json.load(handle)
+    data = read_json(path)
     return SeasonConfig(data.get("seasons", []))
 
 
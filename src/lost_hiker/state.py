@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-import json
+import os
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
 from .character import Character, TimedModifier
+from .json_data import dumps_indented, loads
 from .seasons import SeasonConfig
 
 CURRENT_VERSION = 5
@@ -241,16 +242,18 @@ class GameStateRepository:
     def load(self) -> Optional[GameState]:
         if not self.save_path.exists():
             return None
-        with self.save_path.open("r", encoding="utf-8") as handle:
-            raw = json.load(handle)
+        raw = loads(self.save_path.read_bytes())
         migrated = self._migrate(raw)
         return GameState.from_dict(migrated)
 
     def save(self, state: GameState) -> None:
         state.schema_version = CURRENT_VERSION
         payload = state.to_dict()
-        with self.save_path.open("w", encoding="utf-8") as handle:
-            json.dump(payload, handle, indent=2)
+        # Write a sibling temp file and swap it in, so an interrupted save
+        # leaves the previous save intact instead of a truncated one
+        tmp_path = self.save_path.with_name(self.save_path.name + ".tmp")
+        tmp_path.write_bytes(dumps_indented(payload))
+        os.replace(tmp_path, self.save_path)
 
     def create_new(self, character: Character) -> GameState:
         state = GameState(character=character)
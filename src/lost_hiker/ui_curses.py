@@ -11,14 +11,20 @@ Botany-inspired structural elements:
 - Scrolling menu system
 
 Botany is licensed under ISC License. See THIRD_PARTY_LICENSES.md for details.
+
+Refresh convention: drawing helpers in this module only stage their windows
+with noutrefresh(). Callers flush once with curses.doupdate() before
+waiting for input, so a burst of output costs a single terminal write.
 """
 
 from __future__ import annotations
 
 import curses
 import textwrap
-from dataclasses import dataclass
-from typing import List, Optional, Sequence, Tuple, Union
+from collections import deque
+from dataclasses import astuple, dataclass
+from functools import lru_cache
+from typing import Deque, List, Optional, Sequence, Tuple, Union
 
 from .hunger import apply_stamina_cap
 
@@ -30,6 +36,13 @@ MIN_WIDTH = 100
 # BORDER_THICKNESS cells inside frame_win so every UI pane stays aligned.
 BORDER_THICKNESS = 2
 
+# C0 control characters (and DEL) that addstr would render as ^X pairs,
+# throwing off the width math. Tab and newline are kept: textwrap expands
+# tabs and write_block splits paragraphs on newlines.
+_CONTROL_CHARS = str.maketrans(
+    "", "", "".join(chr(i) for i in range(32) if i not in (9, 10)) + "\x7f"
+)
+
 
 @dataclass
 class UIWindows:
@@ -41,6 +54,10 @@ class UIWindows:
     content_win: curses.window  # Main scrollable text area (inside frame)
     menu_win: curses.window  # Fixed height for menu choices
     input_win: curses.window  # Bottom line: input prompt (inside frame)
+    # Theme + frame size of the last border drawn; lets draw_frame skip redraws
+    border_signature: Optional[tuple] = None
+    # Status text currently drawn in header_win; lets draw_frame skip rewrites
+    header_text: Optional[str] = None
 
 
 @dataclass
@@ -61,6 +78,26 @@ class MenuOption:
 MenuHandleResult = Union[int, None, str]
 MENU_CANCEL = "cancel"
 
+# Key groups for MenuView.handle_key, built once instead of per keypress
+_MENU_KEYS_UP = frozenset((curses.KEY_UP, ord("k")))
+_MENU_KEYS_DOWN = frozenset((curses.KEY_DOWN, ord("j")))
+_MENU_KEYS_PAGE_UP = frozenset((curses.KEY_LEFT, curses.KEY_PPAGE, ord("h")))
+_MENU_KEYS_PAGE_DOWN = frozenset((curses.KEY_RIGHT, curses.KEY_NPAGE, ord("l")))
+_MENU_KEYS_CONFIRM = frozenset((curses.KEY_ENTER, 10, 13, ord(" ")))
+_MENU_KEYS_CANCEL = frozenset((27, ord("q")))
+_MENU_KEY_DIGIT_ONE = ord("1")
+_MENU_KEY_DIGIT_NINE = ord("9")
+
+
+def _menu_highlight_attr() -> int:
+    """Attribute for the selected menu row (reverse video, tinted if colors are set up)."""
+    highlight_attr = curses.A_REVERSE
+    try:
+        highlight_attr |= curses.color_pair(1)
+    except curses.error:
+        pass
+    return highlight_attr
+
 
 class MenuView:
     """
@@ -71,10 +108,14 @@ class MenuView:
     - Render a consistent hint line (`[↑/↓] Move …`) in the reserved bottom row.
     - Provide single entry points for navigation handling via `handle_key`.
 
+    render() only stages the window with noutrefresh; callers must flush
+    with curses.doupdate() before waiting on input or nothing is shown.
+
     Each screen should:
         view = MenuView(options, title="Choose something")
         view.render(menu_win)
         while True:
+            curses.doupdate()
             event = view.handle_key(stdscr.getch())
             if event is None:
                 view.render(menu_win)
@@ -103,12 +144,22 @@ class MenuView:
         self.selected_index = 0
         self.scroll_offset = 0
         self._visible_rows = 0
+        # (height, width, scroll_offset) and selection of the last full paint,
+        # used to repaint only the changed rows when just the selection moved
+        self._painted_layout: Optional[tuple[int, int, int]] = None
+        self._painted_selection = -1
 
         if self.options:
             self.selected_index = max(0, min(selected_index, len(self.options) - 1))
 
     def render(self, win: curses.window) -> None:
-        """Draw menu contents inside the provided curses window."""
+        """
+        Draw menu contents inside the provided curses window.
+
+        When only the selection changed since the previous render (same window
+        size and scroll offset), just the old and new option rows and the hint
+        line are repainted; otherwise the whole window is redrawn.
+        """
         try:
             height, width = win.getmaxyx()
         except curses.error:
@@ -117,6 +168,13 @@ class MenuView:
         if height <= 0 or width <= 0:
             return
 
+        if (
+            self.options
+            and self._painted_layout == (height, width, self.scroll_offset)
+        ):
+            self._render_selection_change(win, width)
+            return
+
         win.erase()
 
         hint_reserved = 1  # Final row for key hints
@@ -133,12 +191,6 @@ class MenuView:
                 pass
             current_y += 1
 
-        highlight_attr = curses.A_REVERSE
-        try:
-            highlight_attr |= curses.color_pair(1)
-        except curses.error:
-            pass
-
         if not self.options:
             placeholder = "No options available."
             try:
@@ -151,26 +203,50 @@ class MenuView:
             for row, option_index in enumerate(range(self.scroll_offset, end_index)):
                 if row >= row_height:
                     break
-                prefix = "> " if option_index == self.selected_index else "  "
-                text = f"{prefix}{self.options[option_index].text}"
-                text = text[: max(1, width - 1)]
-                try:
-                    if option_index == self.selected_index:
-                        win.addstr(current_y + row, 0, text, highlight_attr)
-                    else:
-                        win.addstr(current_y + row, 0, text)
-                except curses.error:
-                    continue
+                self._paint_option(win, option_index, width)
+
+        self._paint_hint(win, height, width)
+        self._painted_layout = (height, width, self.scroll_offset)
+        self._painted_selection = self.selected_index
 
-        hint_y = max(0, height - 1)
-        hint_text = self._build_hint_line(width)
         try:
-            win.addstr(hint_y, 0, hint_text)
+            win.noutrefresh()
+        except curses.error:
+            pass
+
+    def _render_selection_change(self, win: curses.window, width: int) -> None:
+        """Repaint the previously and newly selected rows plus the hint line."""
+        if self._painted_selection != self.selected_index:
+            if 0 <= self._painted_selection < len(self.options):
+                self._paint_option(win, self._painted_selection, width)
+            self._paint_option(win, self.selected_index, width)
+            self._painted_selection = self.selected_index
+        self._paint_hint(win, self._painted_layout[0], width)
+        try:
+            win.noutrefresh()
+        except curses.error:
+            pass
+
+    def _paint_option(self, win: curses.window, option_index: int, width: int) -> None:
+        """Draw one visible option row, highlighted when it is selected."""
+        y = (1 if self.title else 0) + option_index - self.scroll_offset
+        selected = option_index == self.selected_index
+        prefix = "> " if selected else "  "
+        text = f"{prefix}{self.options[option_index].text}"
+        text = text[: max(1, width - 1)]
+        try:
+            if selected:
+                win.addstr(y, 0, text, _menu_highlight_attr())
+            else:
+                win.addstr(y, 0, text)
         except curses.error:
             pass
 
+    def _paint_hint(self, win: curses.window, height: int, width: int) -> None:
+        hint_y = max(0, height - 1)
+        hint_text = self._build_hint_line(width)
         try:
-            win.refresh()
+            win.addstr(hint_y, 0, hint_text)
         except curses.error:
             pass
 
@@ -186,30 +262,30 @@ class MenuView:
         if not self.options:
             return MENU_CANCEL
 
-        if ch in (curses.KEY_UP, ord("k")):
+        if ch in _MENU_KEYS_UP:
             self._move_selection(-1)
             return None
 
-        if ch in (curses.KEY_DOWN, ord("j")):
+        if ch in _MENU_KEYS_DOWN:
             self._move_selection(1)
             return None
 
-        if ch in (curses.KEY_LEFT, curses.KEY_PPAGE, ord("h")):
+        if ch in _MENU_KEYS_PAGE_UP:
             self._page(-1)
             return None
 
-        if ch in (curses.KEY_RIGHT, curses.KEY_NPAGE, ord("l")):
+        if ch in _MENU_KEYS_PAGE_DOWN:
             self._page(1)
             return None
 
-        if ch in (curses.KEY_ENTER, 10, 13, ord(" ")):
+        if ch in _MENU_KEYS_CONFIRM:
             return self.selected_index
 
-        if ch in (27, ord("q")):
+        if ch in _MENU_KEYS_CANCEL:
             return MENU_CANCEL
 
-        if ord("1") <= ch <= ord("9"):
-            numeric_choice = ch - ord("1")
+        if _MENU_KEY_DIGIT_ONE <= ch <= _MENU_KEY_DIGIT_NINE:
+            numeric_choice = ch - _MENU_KEY_DIGIT_ONE
             if numeric_choice < len(self.options):
                 self.selected_index = numeric_choice
                 self._sync_scroll_window()
@@ -279,6 +355,27 @@ COLOR_PAIR_BELLIED = 14
 COLOR_PAIR_DANGER = 15
 
 
+@lru_cache(maxsize=8)
+def _wrapper_for(width: int) -> textwrap.TextWrapper:
+    """Return the shared TextWrapper for a content width."""
+    return textwrap.TextWrapper(
+        width=width,
+        break_long_words=True,
+        break_on_hyphens=False,
+    )
+
+
+@lru_cache(maxsize=512)
+def _wrap_cached(para: str, width: int) -> Tuple[str, ...]:
+    """
+    Wrap a paragraph that does not fit on one line, memoized per width.
+    
+    Scene descriptions and NPC lines repeat often, so the same long
+    paragraphs come back on later turns and after a re-wrap.
+    """
+    return tuple(_wrapper_for(width).wrap(para))
+
+
 class ContentRenderer:
     """
     Renders text content to a curses window with automatic wrapping and scrolling.
@@ -286,6 +383,10 @@ class ContentRenderer:
     Uses a buffer-based approach: all text is stored in a lines buffer,
     and when the buffer exceeds window height, only the most recent lines
     are kept and displayed. This creates a scrolling log effect.
+    
+    The unwrapped source paragraphs are kept alongside the wrapped lines so
+    a width change re-wraps the buffer once instead of leaving lines wrapped
+    to the old width.
     """
     
     def __init__(self, win: curses.window) -> None:
@@ -296,35 +397,76 @@ class ContentRenderer:
             win: Curses window to render content to
         """
         self.win = win
-        self.lines: List[str] = []  # Buffer storing all wrapped lines
+        # Both buffers are bounded by the window height, so appending evicts
+        # the oldest entries without copying the rest
+        visible_height = win.getmaxyx()[0]
+        # Buffer storing the wrapped lines currently on screen
+        self.lines: Deque[str] = deque(maxlen=visible_height)
+        # Most recent unwrapped paragraphs; each yields at least one line,
+        # so keeping visible_height of them covers every buffered line
+        self._paragraphs: Deque[str] = deque(maxlen=visible_height)
+        self._wrap_width = 0
     
-    def _redraw(self) -> None:
+    def _wrap_paragraph(self, para: str) -> List[str]:
+        """
+        Wrap one paragraph to the current wrap width.
+        
+        Args:
+            para: Paragraph text without newlines
+            
+        Returns:
+            Wrapped lines ("" for a blank paragraph)
+        """
+        if not para.strip():
+            # Empty line - add as empty string
+            return [""]
+        if (
+            len(para) <= self._wrap_width
+            and not para.endswith(" ")
+            and para.isprintable()
+        ):
+            # Fits as-is: TextWrapper would return it unchanged, since only
+            # trailing spaces and non-printing whitespace get rewritten
+            return [para]
+        wrapped_lines = list(_wrap_cached(para, self._wrap_width))
+        if not wrapped_lines:
+            # Very long word - truncate
+            wrapped_lines = [para[: self._wrap_width]]
+        return wrapped_lines
+    
+    def _rewrap_all(self) -> None:
+        """Rebuild the wrapped lines buffer from the stored paragraphs."""
+        self.lines.clear()
+        for para in self._paragraphs:
+            self.lines.extend(self._wrap_paragraph(para))
+    
+    def _redraw(self, size: Optional[Tuple[int, int]] = None) -> None:
         """
         Redraw the entire window from the lines buffer.
         
-        Erases the window and draws all lines from the buffer,
-        starting at row 0.
+        Writes every row padded to the full width, starting at row 0, so
+        no erase() is needed and curses only sees cells whose text changed.
+        
+        Args:
+            size: Window (height, width) if the caller already queried it
         """
         try:
-            # Erase the window
-            self.win.erase()
-            
             # Get window dimensions
-            visible_height, visible_width = self.win.getmaxyx()
+            visible_height, visible_width = size or self.win.getmaxyx()
             
-            # Draw each line from the buffer starting at row 0
-            for y, line in enumerate(self.lines):
-                if y >= visible_height:
-                    break
+            rows = list(self.lines)[:visible_height]
+            rows.extend([""] * (visible_height - len(rows)))
+            for y, line in enumerate(rows):
                 try:
-                    # Truncate line to fit width
-                    display_line = line[:visible_width]
-                    self.win.addstr(y, 0, display_line)
+                    # Truncate line to fit width and pad over stale text
+                    self.win.addstr(y, 0, line[:visible_width].ljust(visible_width))
                 except curses.error:
-                    break
+                    # Filling the bottom-right cell reports an error after
+                    # the character has been written
+                    pass
             
             # Refresh the window
-            self.win.refresh()
+            self.win.noutrefresh()
         except curses.error:
             pass
     
@@ -333,12 +475,13 @@ class ContentRenderer:
         Write a block of text, adding it to the buffer and redrawing.
         
         This is the core method that handles buffer management:
-        - Splits text into paragraphs by newline
-        - Wraps each paragraph to window width using textwrap.wrap
-        - Appends wrapped lines to self.lines
-        - Gets visible_height from getmaxyx()
-        - If len(self.lines) > visible_height, keeps only last visible_height lines
-        - Calls _redraw()
+        - Strips control characters and splits text into paragraphs by newline
+        - Re-wraps the whole buffer if the window width changed
+        - Wraps each paragraph to window width (long paragraphs are memoized per width)
+        - Appends wrapped lines to self.lines, whose maxlen of visible_height
+          drops the oldest lines
+        - Draws just the appended lines, or calls _redraw() when the whole
+          window has been replaced
         
         Args:
             text: Text block to write (may contain newlines)
@@ -347,36 +490,72 @@ class ContentRenderer:
         visible_height, visible_width = self.win.getmaxyx()
         wrap_width = max(1, visible_width)
         
-        # Split text into paragraphs by newline
-        paragraphs = text.split("\n")
+        # Resize the bounded buffers if the window height changed
+        resized = visible_height != self.lines.maxlen
+        if resized:
+            self.lines = deque(self.lines, maxlen=visible_height)
+            self._paragraphs = deque(self._paragraphs, maxlen=visible_height)
+        
+        # Re-wrap buffered text only when the width actually changed
+        rewrapped = False
+        if wrap_width != self._wrap_width:
+            self._wrap_width = wrap_width
+            if self._paragraphs:
+                self._rewrap_all()
+                rewrapped = True
+        
+        # Strip control characters once here rather than on every redraw,
+        # then split text into paragraphs by newline
+        paragraphs = text.translate(_CONTROL_CHARS).split("\n")
+        self._paragraphs.extend(paragraphs)
+        previous_count = len(self.lines)
         
-        # Process each paragraph
+        # Wrap each paragraph and add it to the buffer
+        added_count = 0
         for para in paragraphs:
-            if not para.strip():
-                # Empty line - add as empty string
-                self.lines.append("")
-            else:
-                # Wrap paragraph to window width
-                wrapped_lines = textwrap.wrap(
-                    para,
-                    width=wrap_width,
-                    break_long_words=True,
-                    break_on_hyphens=False,
-                )
-                
-                if not wrapped_lines:
-                    # Very long word - truncate
-                    wrapped_lines = [para[:wrap_width]]
-                
-                # Add wrapped lines to buffer
-                self.lines.extend(wrapped_lines)
-        
-        # Trim buffer to keep only the most recent lines that fit
-        if len(self.lines) > visible_height:
-            self.lines = self.lines[-visible_height:]
-        
-        # Redraw the window
-        self._redraw()
+            wrapped = self._wrap_paragraph(para)
+            added_count += len(wrapped)
+            self.lines.extend(wrapped)
+        
+        # Draw only what changed when the window still shows the old buffer
+        size = (visible_height, visible_width)
+        if not (rewrapped or resized) and added_count < visible_height:
+            self._draw_appended(previous_count, added_count, size)
+        else:
+            self._redraw(size)
+    
+    def _draw_appended(
+        self, previous_count: int, added_count: int, size: Tuple[int, int]
+    ) -> None:
+        """
+        Draw newly appended lines without repainting the whole window.
+        
+        Rows already on screen are shifted up in place (insdelln) by however
+        many lines overflowed, then only the new lines are written at the
+        bottom of the buffer.
+        
+        Args:
+            previous_count: Number of buffered lines before the append
+            added_count: Number of lines appended
+            size: Window (height, width) as measured by write_block
+        """
+        try:
+            visible_height, visible_width = size
+            overflow = previous_count + added_count - visible_height
+            if overflow > 0:
+                self.win.move(0, 0)
+                self.win.insdelln(-overflow)
+            
+            start_row = len(self.lines) - added_count
+            for y in range(start_row, len(self.lines)):
+                try:
+                    self.win.addstr(y, 0, self.lines[y][:visible_width])
+                except curses.error:
+                    break
+            
+            self.win.noutrefresh()
+        except curses.error:
+            pass
     
     def write(self, text: str) -> None:
         """
@@ -403,9 +582,10 @@ class ContentRenderer:
     def clear(self) -> None:
         """Clear all content and reset buffer."""
         self.lines.clear()
+        self._paragraphs.clear()
         try:
             self.win.erase()
-            self.win.refresh()
+            self.win.noutrefresh()
         except curses.error:
             pass
     
@@ -562,37 +742,40 @@ def draw_window_border(win: curses.window, border_theme: BorderTheme) -> None:
         
         # Border occupies BORDER_THICKNESS rows/cols; content windows start at that offset.
 
-        # Draw horizontal bands (top and bottom) BORDER_THICKNESS rows thick
+        # Draw horizontal bands (top and bottom) BORDER_THICKNESS rows thick.
+        # hline/vline fill a whole run in one call and never move the cursor,
+        # so the bottom-right cell needs no special casing.
         for offset in range(BORDER_THICKNESS):
             y_top = offset
             y_bottom = max_y - 1 - offset
             if y_top >= max_y or y_bottom < 0:
                 break
-            for x in range(0, max_x):
-                try:
-                    win.addch(y_top, x, border_theme.h_char, attr)
-                    if y_bottom != y_top:
-                        win.addch(y_bottom, x, border_theme.h_char, attr)
-                except curses.error:
-                    break
+            try:
+                win.hline(y_top, 0, border_theme.h_char, max_x, attr)
+                if y_bottom != y_top:
+                    win.hline(y_bottom, 0, border_theme.h_char, max_x, attr)
+            except curses.error:
+                break
         
         # Draw vertical bands (left and right) BORDER_THICKNESS columns thick,
         # skipping the horizontal bands to reduce redraw churn.
         vertical_start = BORDER_THICKNESS
         vertical_end = max_y - BORDER_THICKNESS
         if vertical_start < vertical_end:
+            band_height = vertical_end - vertical_start
             for offset in range(BORDER_THICKNESS):
                 x_left = offset
                 x_right = max_x - 1 - offset
                 if x_left >= max_x or x_right < 0:
                     break
-                for y in range(vertical_start, vertical_end):
-                    try:
-                        win.addch(y, x_left, border_theme.v_char, attr)
-                        if x_right != x_left:
-                            win.addch(y, x_right, border_theme.v_char, attr)
-                    except curses.error:
-                        break
+                try:
+                    win.vline(vertical_start, x_left, border_theme.v_char, band_height, attr)
+                    if x_right != x_left:
+                        win.vline(
+                            vertical_start, x_right, border_theme.v_char, band_height, attr
+                        )
+                except curses.error:
+                    break
         
         # Draw corners
         try:
@@ -765,14 +948,14 @@ def draw_frame(windows: UIWindows, game_state: Optional[object] = None, clear_co
     3. Draw/refresh content_win via ContentRenderer (caller handles this)
     4. Draw/refresh input_win for current prompt (caller handles this)
     
+    Windows are only staged with noutrefresh(); the caller flushes with
+    curses.doupdate().
+    
     Args:
         windows: UIWindows object containing all windows
         game_state: Optional game state for status information
         clear_content: If True, clear the content window. Default False to preserve content.
     """
-    # Clear header (always clear)
-    windows.header_win.erase()
-    
     # Clear input window (always clear)
     windows.input_win.erase()
     
@@ -786,70 +969,95 @@ def draw_frame(windows: UIWindows, game_state: Optional[object] = None, clear_co
     # Get border theme once per frame
     border_theme = get_border_theme(game_state)
     
-    # Draw header on stdscr row 0
-    _draw_header(windows.header_win, game_state)
-    windows.header_win.refresh()
+    # Draw header on stdscr row 0, rewriting it only when the status changed
+    header_text = _header_text(game_state, windows.header_win.getmaxyx()[1])
+    if header_text != windows.header_text:
+        windows.header_win.erase()
+        _draw_header(windows.header_win, header_text)
+        windows.header_text = header_text
+    else:
+        windows.header_win.touchwin()
+    windows.header_win.noutrefresh()
     
-    # Draw border on frame_win (wraps entire play area)
-    draw_window_border(windows.frame_win, border_theme)
+    # Draw border on frame_win (wraps entire play area). The border cells are
+    # never overwritten by the inner windows, so only redraw them when the
+    # theme or frame size changes; otherwise just mark the frame for refresh.
+    border_signature = (astuple(border_theme), windows.frame_win.getmaxyx())
+    if border_signature != windows.border_signature:
+        draw_window_border(windows.frame_win, border_theme)
+        windows.border_signature = border_signature
+    else:
+        windows.frame_win.touchwin()
     
-    # Refresh frame_win (this shows the border)
-    windows.frame_win.refresh()
+    # Stage frame_win (this shows the border once the caller flushes)
+    windows.frame_win.noutrefresh()
     
     # Note: content_win and input_win are refreshed by their respective renderers/callers
     # We don't refresh them here to allow for efficient partial updates
 
 
-def _draw_header(win: curses.window, game_state: Optional[object] = None) -> None:
-    """Draw the header with location, time, stamina, weather."""
-    try:
-        max_y, max_x = win.getmaxyx()
-        if max_x <= 0 or max_y <= 0:
-            return
-        
-        status_parts = []
+def _header_text(game_state: Optional[object], max_x: int) -> str:
+    """
+    Build the header status line with location, time, stamina, weather.
+    
+    Args:
+        game_state: Optional game state for status information
+        max_x: Width of the header window
         
-        if game_state:
-            # Location
-            location = getattr(game_state, "active_zone", "Unknown")
-            status_parts.append(f"Location: {location}")
-            
-            # Day/Season
-            day = getattr(game_state, "day", 1)
-            season = getattr(game_state, "current_season", "spring")
-            status_parts.append(f"Day {day} ({season})")
-            
-            # Stamina
-            stamina = getattr(game_state, "stamina", 0.0)
-            character = getattr(game_state, "character", None)
-            if character:
-                # Get base stamina_max with timed modifiers
-                base_stamina_max = character.get_stat(
-                    "stamina_max",
-                    timed_modifiers=getattr(game_state, "timed_modifiers", []),
-                    current_day=getattr(game_state, "day", 1),
-                )
-                # Apply caps (rest, hunger, condition) to get actual maximum
-                stamina_max = apply_stamina_cap(game_state, base_stamina_max)
-            else:
-                stamina_max = 100.0  # Fallback
-            status_parts.append(f"Stamina: {stamina:.0f}/{stamina_max:.0f}")
-            
-            # Time of day
-            time_of_day = getattr(game_state, "time_of_day", "Day")
-            status_parts.append(f"Time: {time_of_day}")
-        else:
-            status_parts.append("Lost Hiker")
+    Returns:
+        Status text truncated to fit the header
+    """
+    if max_x <= 0:
+        return ""
+    
+    status_parts = []
+    
+    if game_state:
+        # Location
+        location = getattr(game_state, "active_zone", "Unknown")
+        status_parts.append(f"Location: {location}")
         
-        # Join with separators
-        status_text = " | ".join(status_parts)
+        # Day/Season
+        day = getattr(game_state, "day", 1)
+        season = getattr(game_state, "current_season", "spring")
+        status_parts.append(f"Day {day} ({season})")
         
-        # Truncate if too long
-        if len(status_text) > max_x - 1:
-            status_text = status_text[: max_x - 1]
+        # Stamina
+        stamina = getattr(game_state, "stamina", 0.0)
+        character = getattr(game_state, "character", None)
+        if character:
+            # Get base stamina_max with timed modifiers
+            base_stamina_max = character.get_stat(
+                "stamina_max",
+                timed_modifiers=getattr(game_state, "timed_modifiers", []),
+                current_day=getattr(game_state, "day", 1),
+            )
+            # Apply caps (rest, hunger, condition) to get actual maximum
+            stamina_max = apply_stamina_cap(game_state, base_stamina_max)
+        else:
+            stamina_max = 100.0  # Fallback
+        status_parts.append(f"Stamina: {stamina:.0f}/{stamina_max:.0f}")
         
+        # Time of day
+        time_of_day = getattr(game_state, "time_of_day", "Day")
+        status_parts.append(f"Time: {time_of_day}")
+    else:
+        status_parts.append("Lost Hiker")
+    
+    # Join with separators
+    status_text = " | ".join(status_parts)
+    
+    # Truncate if too long
+    if len(status_text) > max_x - 1:
+        status_text = status_text[: max_x - 1]
+    
+    return status_text
+
+
+def _draw_header(win: curses.window, status_text: str) -> None:
+    """Draw the header status line in the header window."""
+    try:
         win.addstr(0, 0, status_text, curses.color_pair(2) | curses.A_BOLD)
-        win.refresh()
     except curses.error:
         pass
 
@@ -885,6 +1093,7 @@ def read_input(prompt: str, windows: UIWindows) -> str:
         cursor_x = len(prompt_text)
         windows.input_win.move(0, cursor_x)
         curses.curs_set(1)  # Show cursor for input
+        # Full refresh: also flushes anything staged by draw_frame
         windows.input_win.refresh()
         
         # Get input
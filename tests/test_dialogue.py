@@ -0,0 +1,45 @@
+"""Tests for dialogue catalog loading."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from lost_hiker.dialogue import LazyDialogueCatalog
+
+
+def _write_dialogue(path: Path, npc_id: str, node_ids: list[str]) -> None:
+    nodes = [
+        {"id": node_id, "npc_id": npc_id, "text": f"{node_id} text", "options": []}
+        for node_id in node_ids
+    ]
+    path.write_text(json.dumps({"nodes": nodes}), encoding="utf-8")
+
+
+def test_lazy_catalog_loads_on_first_lookup(tmp_path: Path) -> None:
+    _write_dialogue(tmp_path / "first.json", "hermit", ["start", "hermit_more"])
+    catalog = LazyDialogueCatalog(tmp_path, ["first.json", "second.json"])
+    # Written after construction: nothing may be read until first use
+    _write_dialogue(tmp_path / "second.json", "naiad", ["naiad_start"])
+
+    node = catalog.get_node("naiad_start")
+
+    assert node is not None
+    assert node.npc_id == "naiad"
+    # Nodes are merged in file order
+    assert [node.node_id for node in catalog.nodes] == [
+        "start",
+        "hermit_more",
+        "naiad_start",
+    ]
+    starting = catalog.get_starting_node("hermit")
+    assert starting is not None
+    assert starting.node_id == "start"
+
+
+def test_lazy_catalog_skips_missing_files(tmp_path: Path) -> None:
+    _write_dialogue(tmp_path / "present.json", "druid", ["druid_start"])
+    catalog = LazyDialogueCatalog(tmp_path, ["missing.json", "present.json"])
+
+    assert [node.node_id for node in catalog.nodes] == ["druid_start"]
+    assert catalog.get_node("start") is None
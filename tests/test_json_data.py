@@ -0,0 +1,29 @@
+"""Tests for the shared JSON helpers."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from lost_hiker.json_data import read_json_cached
+
+
+def test_read_json_cached_reuses_unchanged_file(tmp_path: Path) -> None:
+    path = tmp_path / "catalog.json"
+    path.write_text(json.dumps({"items": [1, 2]}), encoding="utf-8")
+
+    assert read_json_cached(path) is read_json_cached(path)
+
+
+def test_read_json_cached_rereads_after_mtime_change(tmp_path: Path) -> None:
+    path = tmp_path / "catalog.json"
+    path.write_text(json.dumps({"version": 1}), encoding="utf-8")
+    stat = path.stat()
+    assert read_json_cached(path) == {"version": 1}
+
+    path.write_text(json.dumps({"version": 2}), encoding="utf-8")
+    # Set the mtime explicitly so coarse filesystem timestamps cannot hide the edit
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert read_json_cached(path) == {"version": 2}
@@ -0,0 +1,45 @@
+"""Tests for the entry-point module."""
+
+from __future__ import annotations
+
+import ast
+import io
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from lost_hiker import main
+
+
+def _main_module_tree() -> ast.Module:
+    return ast.parse(Path(main.__file__).read_text(encoding="utf-8"))
+
+
+def test_main_defines_each_class_once() -> None:
+    """A second class with the same name silently replaces the first."""
+    tree = _main_module_tree()
+    names = Counter(node.name for node in tree.body if isinstance(node, ast.ClassDef))
+    duplicates = [name for name, count in names.items() if count > 1]
+    assert duplicates == []
+
+
+def test_main_classes_define_each_method_once() -> None:
+    """A repeated method definition silently overrides the earlier one."""
+    tree = _main_module_tree()
+    for cls in (node for node in tree.body if isinstance(node, ast.ClassDef)):
+        names = Counter(
+            node.name
+            for node in cls.body
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+        )
+        duplicates = [name for name, count in names.items() if count > 1]
+        assert duplicates == [], f"{cls.name} redefines {duplicates}"
+
+
+def test_console_menu_matches_numeric_label_after_index_miss(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """An out-of-range number still selects an option with that label."""
+    monkeypatch.setattr("sys.stdin", io.StringIO("10\n"))
+    assert main.ConsoleUI().menu("Pick", ["a", "b", "10"]) == "10"
@@ -0,0 +1,50 @@
+"""Tests for saving and loading game state."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from lost_hiker import state as state_module
+from lost_hiker.character import Character
+from lost_hiker.state import GameStateRepository
+
+
+def _repo(tmp_path: Path) -> GameStateRepository:
+    return GameStateRepository(tmp_path / "save" / "save.json")
+
+
+def test_save_round_trip(tmp_path: Path) -> None:
+    repo = _repo(tmp_path)
+    saved = repo.create_new(Character(name="Wren"))
+    saved.day = 4
+    repo.save(saved)
+
+    loaded = repo.load()
+
+    assert loaded is not None
+    assert loaded.character.name == "Wren"
+    assert loaded.day == 4
+    assert loaded.inventory == saved.inventory
+    # The temp file is swapped into place, not left beside the save
+    assert sorted(path.name for path in repo.save_path.parent.iterdir()) == ["save.json"]
+
+
+def test_failed_save_keeps_previous_save(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    repo = _repo(tmp_path)
+    game = repo.create_new(Character(name="Wren"))
+    repo.save(game)
+    before = repo.save_path.read_bytes()
+
+    def fail_replace(src: object, dst: object) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(state_module.os, "replace", fail_replace)
+    game.day = 9
+    with pytest.raises(OSError):
+        repo.save(game)
+
+    assert repo.save_path.read_bytes() == before